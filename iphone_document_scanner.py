@@ -31,52 +31,188 @@ import os
 import sys
 import time
 import argparse
+import contextlib
+import functools
+import importlib
 import logging
+import math
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional, Tuple, Dict, Any
-from enum import Enum
-
-# PyObjC imports - These provide Python bindings to Objective-C frameworks
-import objc
-
-# AppKit imports - macOS application framework components
-from AppKit import (
-    NSApplication, NSWindow, NSViewController, NSResponder,
-    NSImageView, NSButton, NSMenu, NSMenuItem, NSImage,
-    NSPasteboard, NSWindowController, NSRect, NSMakeRect,
-    NSBackingStoreBuffered, NSWindowStyleMaskTitled,
-    NSWindowStyleMaskClosable, NSWindowStyleMaskMiniaturizable,
-    NSWindowStyleMaskResizable, NSApp, NSApplicationActivationPolicyRegular,
-    NSEvent, NSBitmapImageFileTypePNG, NSBitmapImageRep,
-    NSStackView, NSUserInterfaceLayoutOrientationVertical,
-    NSTextField, NSFont, NSTextAlignmentCenter,
-    NSPasteboardTypePDF, NSPasteboardTypeTIFF, NSPasteboardTypePNG,
-    NSBitmapImageFileTypeJPEG, NSBitmapImageFileTypeTIFF,
-    NSPDFImageRep, NSImageRep, NSScrollView, NSTextView,
-    NSMakeSize, NSWorkspace
+from enum import IntEnum
+
+__version__ = "2.0.0"
+
+
+# ================================
+# Lazy PyObjC Imports
+# ================================
+# Importing AppKit, Foundation and Quartz loads the Objective-C runtime and
+# binds every symbol we ask for. That is wasted work for --help, --version
+# or --list-formats, so the frameworks are only imported the first time one
+# of their symbols is actually used. argparse and enum stay eager.
+
+# AppKit - macOS application framework components
+_APPKIT_SYMS = (
+    'NSApplication', 'NSWindow', 'NSViewController', 'NSResponder',
+    'NSImageView', 'NSButton', 'NSMenu', 'NSMenuItem', 'NSImage',
+    'NSPasteboard', 'NSWindowController', 'NSRect', 'NSMakeRect',
+    'NSBackingStoreBuffered', 'NSWindowStyleMaskTitled',
+    'NSWindowStyleMaskClosable', 'NSWindowStyleMaskMiniaturizable',
+    'NSWindowStyleMaskResizable', 'NSApp', 'NSApplicationActivationPolicyRegular',
+    'NSEvent', 'NSBitmapImageFileTypePNG', 'NSBitmapImageRep',
+    'NSStackView', 'NSUserInterfaceLayoutOrientationVertical',
+    'NSTextField', 'NSFont', 'NSTextAlignmentCenter',
+    'NSPasteboardTypePDF', 'NSPasteboardTypeTIFF', 'NSPasteboardTypePNG',
+    'NSBitmapImageFileTypeJPEG', 'NSBitmapImageFileTypeTIFF',
+    'NSPDFImageRep', 'NSImageRep', 'NSScrollView', 'NSTextView',
+    'NSMakeSize', 'NSWorkspace',
 )
 
-# Foundation imports - Core services framework
-from Foundation import (
-    NSMutableArray, NSURL, NSData, NSPropertyListSerialization,
-    NSPropertyListImmutable, NSError
+# Foundation - Core services framework
+_FOUNDATION_SYMS = (
+    'NSMutableArray', 'NSURL', 'NSData', 'NSPropertyListSerialization',
+    'NSPropertyListImmutable', 'NSError',
 )
 
-# Quartz imports - PDF and graphics framework
-from Quartz import PDFDocument, PDFPage
+# Quartz - PDF and graphics framework
+_QUARTZ_SYMS = ('PDFDocument', 'PDFPage')
+
+# Symbol name -> framework module, used by the module level __getattr__
+_SYMBOL_MODULES: Dict[str, str] = {
+    **{name: 'AppKit' for name in _APPKIT_SYMS},
+    **{name: 'Foundation' for name in _FOUNDATION_SYMS},
+    **{name: 'Quartz' for name in _QUARTZ_SYMS},
+}
+
+# Cache of resolved symbols, keyed by (module name, attribute name)
+_LAZY_CACHE: Dict[Tuple[str, str], Any] = {}
+
+
+def _lazy(module_name, attr):
+    """
+    Resolve ``module_name.attr``, importing the module on first use.
+    
+    Args:
+        module_name: Name of the module to import (e.g. 'AppKit')
+        attr: Name of the symbol to fetch from it
+        
+    Returns:
+        The resolved symbol (cached for subsequent calls)
+    """
+    key = (module_name, attr)
+    try:
+        return _LAZY_CACHE[key]
+    except KeyError:
+        value = getattr(importlib.import_module(module_name), attr)
+        _LAZY_CACHE[key] = value
+        return value
+
+
+class _LazyModule:
+    """Module proxy that resolves attributes through _lazy() on first access."""
+    
+    def __init__(self, module_name):
+        self._module_name = module_name
+    
+    def __getattr__(self, attr):
+        return _lazy(self._module_name, attr)
+
+
+# PyObjC imports - These provide Python bindings to Objective-C frameworks.
+# Code in this module refers to framework symbols through these proxies,
+# e.g. AK.NSBitmapImageRep or QZ.PDFDocument.
+objc = _LazyModule('objc')
+AK = _LazyModule('AppKit')
+FN = _LazyModule('Foundation')
+QZ = _LazyModule('Quartz')
+
+
+def __getattr__(name):
+    """
+    PEP 562 hook: keep ``iphone_document_scanner.NSPasteboard`` and friends
+    importable by resolving them (and the Cocoa controller classes) lazily.
+    """
+    if name in _COCOA_CLASS_NAMES:
+        _load_cocoa_classes()
+        return globals()[name]
+    module_name = _SYMBOL_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return _lazy(module_name, name)
 
 
 # ================================
 # Configuration and Constants
 # ================================
 
-class OutputFormat(Enum):
-    """Enumeration of supported output formats for scanned documents."""
-    PDF = "pdf"
-    PNG = "png"
-    JPEG = "jpeg"
-    TIFF = "tiff"
+class OutputFormat(IntEnum):
+    """
+    Enumeration of supported output formats for scanned documents.
+    
+    Members are small consecutive integers, so per-format tables such as
+    _FORMAT_SPECS can be indexed directly with a member.
+    """
+    PDF = 0
+    PNG = 1
+    JPEG = 2
+    TIFF = 3
+    
+    @property
+    def spec(self):
+        """Static FormatSpec data for this format."""
+        return _FORMAT_SPECS[self]
+    
+    @property
+    def extension(self):
+        """File extension used when saving in this format."""
+        return _FORMAT_SPECS[self].ext
+
+
+# Everything the export code needs to know about a format, in one record:
+#   ext      - file extension
+#   uti      - Uniform Type Identifier, used both as pasteboard type
+#              (NSPasteboardTypePDF is 'com.adobe.pdf') and as the
+#              ImageIO destination type
+FormatSpec = namedtuple("FormatSpec", "ext uti")
+
+# Indexed by OutputFormat
+_FORMAT_SPECS = (
+    FormatSpec("pdf", "com.adobe.pdf"),
+    FormatSpec("png", "public.png"),
+    FormatSpec("jpeg", "public.jpeg"),
+    FormatSpec("tiff", "public.tiff"),
+)
+
+# Pasteboard/file type -> OutputFormat, for recognizing source image data
+# that can be written out unchanged
+_UTI_FORMATS = {spec.uti: OutputFormat(i) for i, spec in enumerate(_FORMAT_SPECS)}
+
+# Pasteboard types probed when reading a scan, in order of preference.
+# NSPasteboardTypePDF, NSPasteboardTypeTIFF and NSPasteboardTypePNG are the
+# 'com.adobe.pdf', 'public.tiff' and 'public.png' UTIs, so plain strings
+# cover them without importing AppKit.
+_PDF_PASTEBOARD_TYPES = ('com.adobe.pdf', 'public.pdf')
+_IMAGE_PASTEBOARD_TYPES = (
+    'public.tiff',   # TIFF can contain multiple images
+    'public.png',    # Lossless compression
+    'public.jpeg',   # Lossy but common
+    'public.image',  # Generic image type
+)
+
+
+# Module logger, fetched once. Handlers are configured on the root logger
+# (see Config.setup_logging), which this logger propagates to.
+log = logging.getLogger(__name__)
+
+# Log line format, built once and shared by every handler we install
+_LOG_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(levelname)s - %(message)s',
+    datefmt='%H:%M:%S'
+)
 
 
 class Config:
@@ -84,15 +220,42 @@ class Config:
     
     def __init__(self):
         """Initialize configuration with default values."""
-        self.output_dir: Path = Path.cwd()
+        # Resolved lazily, so creating the global config has no filesystem
+        # side effects (see the output_dir property)
+        self._output_dir: Optional[Path] = None
+        self._output_dir_str: Optional[str] = None
         self.filename_prefix: str = "scanned_document"
-        self.output_formats: List[OutputFormat] = [OutputFormat.PDF, OutputFormat.PNG]
+        self.output_formats: Tuple[OutputFormat, ...] = (OutputFormat.PDF, OutputFormat.PNG)
+        self.output_formats_display: str = "PDF, PNG"  # Format names for messages
         self.verbose: bool = False
         self.quiet: bool = False
         self.resolution_scale: float = 4.0  # Scale factor for high-resolution extraction
         self.jpeg_quality: float = 0.95  # JPEG compression quality (0.0-1.0)
         self.debug_mode: bool = False
         self.open_in_preview: bool = False  # Open saved files in Preview app
+        self.max_pasteboard_bytes: int = 256 * 1024 * 1024  # Larger PDFs are kept raw only
+        # Encoder property dictionaries, indexed by OutputFormat (see finalize)
+        self.destination_properties: Tuple[Any, ...] = ()
+        
+    @property
+    def output_dir(self) -> Path:
+        """Directory for saved documents (defaults to the current directory)."""
+        return self._output_dir or Path.cwd()
+    
+    @output_dir.setter
+    def output_dir(self, value: Path):
+        self._output_dir = value
+        self._output_dir_str = os.fspath(value)
+    
+    @property
+    def output_dir_str(self) -> str:
+        """output_dir as a string, converted once when the directory is set."""
+        return self._output_dir_str or os.getcwd()
+    
+    @property
+    def image_formats(self) -> List[OutputFormat]:
+        """Requested formats that are saved page by page (all but PDF)."""
+        return [fmt for fmt in self.output_formats if fmt is not OutputFormat.PDF]
         
     def setup_logging(self):
         """Configure logging based on verbose/quiet settings."""
@@ -103,793 +266,1389 @@ class Config:
         else:
             level = logging.INFO
             
-        logging.basicConfig(
-            level=level,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            datefmt='%H:%M:%S'
+        # force=True replaces any handlers installed earlier, so calling this
+        # again (e.g. after changing verbosity) actually takes effect
+        handler = logging.StreamHandler()
+        handler.setFormatter(_LOG_FORMATTER)
+        logging.basicConfig(level=level, handlers=[handler], force=True)
+    
+    def finalize(self):
+        """
+        Apply the settings once they are final (after CLI parsing).
+        
+        Sets up logging and prebuilds the encoder property dictionaries,
+        so the per-page save loops pass ready-made NSDictionary objects
+        instead of bridging a fresh Python dict for every page and format.
+        """
+        self.setup_logging()
+        
+        # Freeze the format list and its display form for the save paths
+        self.output_formats = tuple(self.output_formats)
+        self.output_formats_display = ", ".join(f.name for f in self.output_formats)
+        
+        empty = FN.NSDictionary.dictionary()
+        jpeg = FN.NSDictionary.dictionaryWithObject_forKey_(
+            self.jpeg_quality, QZ.kCGImageDestinationLossyCompressionQuality
         )
+        # PNG and TIFF use ImageIO's default encoder settings
+        self.destination_properties = (empty, empty, jpeg, empty)
 
 
 # Global configuration instance
 config = Config()
 
 
+# Debug report annotations for the common pasteboard types, looked up by
+# exact UTI before falling back to substring checks (see _debug_type_label)
+_PDF_LABEL = "  -> PDF data detected (multi-page document)\n"
+_IMAGE_LABEL = "  -> Image data detected (single image)\n"
+_TIFF_LABEL = "  -> TIFF data detected (can contain multiple images)\n"
+_UTI_LABEL = {
+    'com.adobe.pdf': _PDF_LABEL,
+    'public.pdf': _PDF_LABEL,
+    'public.png': _IMAGE_LABEL,
+    'public.image': _IMAGE_LABEL,
+    'public.tiff': _TIFF_LABEL,
+}
+
+
+def _debug_type_label(type_str):
+    """
+    Return the debug report annotation for a pasteboard type, or None.
+    
+    Args:
+        type_str: Pasteboard type (UTI) as reported by NSPasteboard.types()
+    """
+    label = _UTI_LABEL.get(type_str)
+    if label is not None:
+        return label
+    type_name = type_str.lower()
+    if 'pdf' in type_name:
+        return _PDF_LABEL
+    if 'image' in type_name or 'png' in type_name:
+        return _IMAGE_LABEL
+    if 'tiff' in type_name:
+        return _TIFF_LABEL
+    return None
+
+
 # ================================
-# View Controller Implementation
+# Cocoa Singletons
 # ================================
+# These objects live for the whole process, so they are fetched from the
+# Objective-C side once instead of through a bridged class method call
+# every time. They are cached on first use rather than at import time,
+# which keeps AppKit out of the CLI-only paths.
+
+@functools.lru_cache(maxsize=None)
+def _general_pasteboard():
+    """Return the system-wide NSPasteboard (the clipboard)."""
+    return AK.NSPasteboard.generalPasteboard()
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_application():
+    """Return the shared NSApplication (NSApp), creating it on first use."""
+    return AK.NSApplication.sharedApplication()
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_workspace():
+    """Return the shared NSWorkspace used to open files in other apps."""
+    return AK.NSWorkspace.sharedWorkspace()
+
+
+@functools.lru_cache(maxsize=None)
+def _preview_app_url():
+    """Return the file URL of Preview.app, or None if it cannot be found."""
+    return _shared_workspace().URLForApplicationWithBundleIdentifier_("com.apple.Preview")
+
 
-class ContinuityCameraViewController(NSViewController):
+@functools.lru_cache(maxsize=None)
+def _file_url():
+    """Return the bound NSURL.fileURLWithPath_ used for every output file."""
+    return FN.NSURL.fileURLWithPath_
+
+
+@contextlib.contextmanager
+def _user_activity(reason):
     """
-    View Controller for Continuity Camera functionality.
-    
-    This class manages the user interface and handles the interaction
-    with iOS devices through the Continuity Camera feature. It demonstrates:
-    - Creating UI elements programmatically using AppKit
-    - Handling pasteboard (clipboard) data transfer
-    - Processing multi-page PDF documents
-    - Converting between image formats
-    
-    Attributes:
-        imageView: Preview display for scanned documents
-        statusLabel: Status message display
-        captureButton: Initiates document scanning
-        saveButton: Saves captured documents
-        debugButton: Shows pasteboard contents (educational)
-        scrollView: Container for debug output
-        textView: Debug information display
-        captured_data: Raw PDF data from scanner
-        captured_images: List of processed images
+    Hold an NSProcessInfo activity for the duration of a ``with`` block.
+    
+    Keeps App Nap from throttling a capture, save or conversion while it
+    runs. The activity still lets the Mac idle-sleep, and it is only held
+    while there is work to do, not while the window waits for a scan.
+    
+    Args:
+        reason: Short description of the work, shown by diagnostics tools
     """
+    process_info = FN.NSProcessInfo.processInfo()
+    activity = process_info.beginActivityWithOptions_reason_(
+        FN.NSActivityUserInitiatedAllowingIdleSystemSleep, reason
+    )
+    try:
+        yield
+    finally:
+        process_info.endActivity_(activity)
+
+
+@functools.lru_cache(maxsize=None)
+def _bitmap_rep_predicate():
+    """Return an NSPredicate matching NSBitmapImageRep instances."""
+    return FN.NSPredicate.predicateWithFormat_(
+        "self isKindOfClass: %@", AK.NSBitmapImageRep
+    )
+
+
+# ================================
+# PDF Rendering
+# ================================
+
+def _rasterize_pdf_page(page, scale):
+    """
+    Rasterize a PDF page into a CGImage at ``scale`` times its natural size.
     
-    # Instance variables (ivars) - Objective-C style property declarations
-    imageView = objc.ivar()
-    statusLabel = objc.ivar()
-    captureButton = objc.ivar()
-    saveButton = objc.ivar()
-    convertToPngButton = objc.ivar()
-    debugButton = objc.ivar()
-    scrollView = objc.ivar()
-    textView = objc.ivar()
-    captured_data = objc.ivar()
-    captured_images = objc.ivar()
-    
-    def init(self):
-        """
-        Initialize the view controller.
-        
-        This method is called when the object is created. It sets up
-        initial state before the view is loaded.
-        
-        Returns:
-            self: The initialized instance
-        """
-        # Call parent class initializer
-        self = objc.super(ContinuityCameraViewController, self).init()
-        if self:
-            self.captured_data = None
-            self.captured_images = []
-            logging.debug("ContinuityCameraViewController initialized")
-        return self
-    
-    def loadView(self):
-        """
-        Create and configure the user interface.
-        
-        This method builds the UI programmatically using a vertical stack view
-        layout. Each UI element is created, configured, and added to the view
-        hierarchy.
-        
-        The UI consists of:
-        - Status label for user feedback
-        - Image view for document preview
-        - Debug text area (educational feature)
-        - Control buttons for scanning and saving
-        """
-        logging.debug("Loading view...")
-        
-        # Create main container view with specified dimensions
-        frame = NSMakeRect(0, 0, 700, 600)
-        self.setView_(NSStackView.alloc().initWithFrame_(frame))
-        view = self.view()
-        
-        # Configure stack view for vertical layout with spacing
-        view.setOrientation_(NSUserInterfaceLayoutOrientationVertical)
-        view.setSpacing_(20)  # Pixels between elements
-        view.setEdgeInsets_((20, 20, 20, 20))  # Top, right, bottom, left padding
-        
-        # ---- Status Label ----
-        # Provides feedback to the user about current operations
-        self.statusLabel = NSTextField.alloc().initWithFrame_(NSMakeRect(0, 0, 660, 30))
-        self.statusLabel.setStringValue_("Click 'Scan Document' to start scanning with your iPhone")
-        self.statusLabel.setEditable_(False)  # Read-only
-        self.statusLabel.setBordered_(False)  # No border
-        self.statusLabel.setBackgroundColor_(None)  # Transparent background
-        self.statusLabel.setAlignment_(NSTextAlignmentCenter)
-        self.statusLabel.setFont_(NSFont.systemFontOfSize_(14))
-        
-        # ---- Image View ----
-        # Displays preview of scanned documents
-        self.imageView = NSImageView.alloc().initWithFrame_(NSMakeRect(0, 0, 660, 350))
-        # NSImageScaleProportionallyDown = 3: Scale down only if needed, maintaining aspect ratio
-        self.imageView.setImageScaling_(3)
-        self.imageView.setImageFrameStyle_(2)  # Adds a decorative frame
-        
-        # ---- Debug Text View ----
-        # Educational feature: shows pasteboard contents for learning
-        self.scrollView = NSScrollView.alloc().initWithFrame_(NSMakeRect(0, 0, 660, 100))
-        self.textView = NSTextView.alloc().initWithFrame_(NSMakeRect(0, 0, 660, 100))
-        self.textView.setEditable_(False)
-        self.textView.setRichText_(False)  # Plain text only
-        self.scrollView.setDocumentView_(self.textView)
-        self.scrollView.setHasVerticalScroller_(True)
-        
-        # ---- Capture Button ----
-        # Triggers the Continuity Camera menu
-        self.captureButton = NSButton.alloc().initWithFrame_(NSMakeRect(0, 0, 200, 40))
-        self.captureButton.setTitle_("Scan Document")
-        self.captureButton.setTarget_(self)  # This object handles the action
-        self.captureButton.setAction_(objc.selector(self.showContinuityMenu_, signature=b'v@:@'))
-        self.captureButton.setBezelStyle_(1)  # Standard push button style
-        
-        # ---- Save Button ----
-        # Saves captured documents to disk
-        self.saveButton = NSButton.alloc().initWithFrame_(NSMakeRect(0, 0, 200, 40))
-        self.saveButton.setTitle_("Save All Pages")
-        self.saveButton.setTarget_(self)
-        self.saveButton.setAction_(objc.selector(self.saveAllDocuments_, signature=b'v@:@'))
-        self.saveButton.setBezelStyle_(1)
-        self.saveButton.setEnabled_(False)  # Disabled until documents are captured
-        
-        # ---- Convert to PNG Button ----
-        # Converts PDF pages to PNG format
-        self.convertToPngButton = NSButton.alloc().initWithFrame_(NSMakeRect(0, 0, 200, 40))
-        self.convertToPngButton.setTitle_("Convert PDF to PNG")
-        self.convertToPngButton.setTarget_(self)
-        self.convertToPngButton.setAction_(objc.selector(self.convertPdfToPng_, signature=b'v@:@'))
-        self.convertToPngButton.setBezelStyle_(1)
-        self.convertToPngButton.setEnabled_(False)  # Disabled until PDF is captured
-        
-        # ---- Debug Button ----
-        # Educational: shows what data types are available in pasteboard
-        self.debugButton = NSButton.alloc().initWithFrame_(NSMakeRect(0, 0, 200, 40))
-        self.debugButton.setTitle_("Debug Pasteboard")
-        self.debugButton.setTarget_(self)
-        self.debugButton.setAction_(objc.selector(self.debugPasteboard_, signature=b'v@:@'))
-        self.debugButton.setBezelStyle_(1)
-        
-        # Add UI elements to main view
-        view.addArrangedSubview_(self.statusLabel)
-        view.addArrangedSubview_(self.imageView)
-        
-        # Only show debug area if debug mode is enabled
-        if config.debug_mode:
-            view.addArrangedSubview_(self.scrollView)
-        
-        # Create horizontal container for buttons
-        buttonContainer = NSStackView.alloc().init()
-        buttonContainer.setOrientation_(0)  # 0 = Horizontal orientation
-        buttonContainer.setSpacing_(20)
-        buttonContainer.addArrangedSubview_(self.captureButton)
-        buttonContainer.addArrangedSubview_(self.saveButton)
-        buttonContainer.addArrangedSubview_(self.convertToPngButton)
-        
-        if config.debug_mode:
-            buttonContainer.addArrangedSubview_(self.debugButton)
-        
-        view.addArrangedSubview_(buttonContainer)
-        
-        logging.debug("View loaded successfully")
+    The page is drawn once, directly into a Core Graphics bitmap context
+    sized to the final pixel dimensions. Scaling the context's CTM lets
+    Quartz rasterize the page at the target resolution itself, instead of
+    drawing it at a lower resolution and resampling the result afterwards.
     
-    def validRequestorForSendType_returnType_(self, sendType, returnType):
-        """
-        Declare what data types this view can accept.
-        
-        This method is part of the NSServicesRequests protocol. It tells
-        the system that this view controller can accept data from other
-        applications or services.
-        
-        Args:
-            sendType: The type of data to send (not used here)
-            returnType: The type of data we can receive
-            
-        Returns:
-            self if we can handle the returnType, otherwise delegates to parent
-        """
-        if returnType:
-            # We accept any return type (images, PDFs, etc.)
-            return self
-        return objc.super(ContinuityCameraViewController, self).validRequestorForSendType_returnType_(
-            sendType, returnType
-        )
+    Only Core Graphics is used for drawing (no NSImage/lockFocus and no
+    AppKit graphics context), so this is safe to call from worker threads;
+    the page is drawn through its immutable CGPDFPage.
     
-    def debugPasteboard_(self, sender):
-        """
-        Educational method: Display pasteboard contents for debugging.
-        
-        This method inspects the general pasteboard (clipboard) and shows
-        all available data types and their sizes. This is useful for
-        understanding how data is transferred between applications in macOS.
-        
-        Args:
-            sender: The button that triggered this action
-        """
-        logging.debug("Debugging pasteboard...")
+    Args:
+        page: PDFPage to render
+        scale: Resolution scale factor (1.0 = 72 DPI)
         
-        # Get the general pasteboard (system clipboard)
-        pb = NSPasteboard.generalPasteboard()
-        types = pb.types()
-        
-        # Build debug information string
-        debug_info = "=== Pasteboard Debug Info ===\n"
-        debug_info += f"Available types: {len(types)}\n\n"
-        
-        # Iterate through all data types in pasteboard
-        for type_str in types:
-            debug_info += f"Type: {type_str}\n"
-            data = pb.dataForType_(type_str)
-            if data:
-                debug_info += f"  Data size: {len(data)} bytes\n"
-                
-                # Identify common data types for educational purposes
-                if 'pdf' in str(type_str).lower():
-                    debug_info += "  -> PDF data detected (multi-page document)\n"
-                elif 'image' in str(type_str).lower() or 'png' in str(type_str).lower():
-                    debug_info += "  -> Image data detected (single image)\n"
-                elif 'tiff' in str(type_str).lower():
-                    debug_info += "  -> TIFF data detected (can contain multiple images)\n"
-            debug_info += "\n"
-        
-        # Display in UI and console
-        self.textView.setString_(debug_info)
-        logging.info(debug_info)
+    Returns:
+        CGImage containing the rendered page
+    """
+    page_ref = page.pageRef()
+    media_box = QZ.CGPDFPageGetBoxRect(page_ref, QZ.kCGPDFMediaBox)
+    width = int(round(media_box.size.width * scale))
+    height = int(round(media_box.size.height * scale))
     
-    def readSelectionFromPasteboard_(self, pasteboard):
-        """
-        Read and process scanned documents from the pasteboard.
-        
-        This is the core method that handles data transfer from the iPhone
-        scanner. It demonstrates:
-        1. Reading different data formats from pasteboard
-        2. PDF processing for multi-page documents
-        3. High-resolution image extraction
-        4. Format conversion
-        
-        Args:
-            pasteboard: The NSPasteboard containing scanned data
-            
-        Returns:
-            bool: True if data was successfully read, False otherwise
-        """
-        logging.info("Reading data from pasteboard...")
-        
-        debug_info = "=== Reading from Pasteboard ===\n"
-        types = pasteboard.types()
-        debug_info += f"Available types: {types}\n\n"
-        
-        # Reset captured data
-        self.captured_images = []
-        self.captured_data = None
-        
-        # ---- Step 1: Try to get PDF data (preferred for multi-page) ----
-        # PDF is the best format as it preserves vector graphics and can
-        # contain multiple pages in a single file
-        pdf_types = ['com.adobe.pdf', NSPasteboardTypePDF, 'public.pdf']
-        pdf_data = None
-        
-        for pdf_type in pdf_types:
-            if pdf_type in types:
-                pdf_data = pasteboard.dataForType_(pdf_type)
-                if pdf_data:
-                    debug_info += f"Found PDF data of size: {len(pdf_data)} bytes\n"
-                    logging.info(f"Retrieved PDF data: {len(pdf_data)} bytes")
-                    break
-        
-        if pdf_data:
-            # Store raw PDF for later saving
-            self.captured_data = pdf_data
-            
-            # ---- Step 2: Extract pages from PDF ----
-            # PDFDocument is part of the Quartz framework
-            pdf_doc = PDFDocument.alloc().initWithData_(pdf_data)
-            if pdf_doc:
-                page_count = pdf_doc.pageCount()
-                debug_info += f"PDF has {page_count} pages\n"
-                logging.info(f"Processing {page_count} page(s) from PDF")
-                
-                # Process each page
-                for i in range(page_count):
-                    page = pdf_doc.pageAtIndex_(i)
-                    if page:
-                        # Get page dimensions
-                        bounds = page.boundsForBox_(0)  # 0 = kPDFDisplayBoxMediaBox
-                        
-                        # ---- High-Resolution Rendering ----
-                        # Scale up the rendering for better quality when saving as images
-                        scale_factor = config.resolution_scale
-                        size = NSMakeSize(
-                            bounds.size.width * scale_factor,
-                            bounds.size.height * scale_factor
-                        )
-                        
-                        # Create NSImage and render PDF page into it
-                        image = NSImage.alloc().initWithSize_(size)
-                        image.lockFocus()  # Begin drawing context
-                        
-                        # Apply scaling transformation
-                        transform = objc.lookUpClass('NSAffineTransform').transform()
-                        transform.scaleBy_(scale_factor)
-                        transform.concat()
-                        
-                        # Render PDF page at high resolution
-                        page.drawWithBox_(0)
-                        
-                        image.unlockFocus()  # End drawing context
-                        
-                        # Store the rendered image
-                        self.captured_images.append(image)
-                        debug_info += f"  Page {i+1}: {size.width}x{size.height} pixels\n"
-                        logging.debug(f"Rendered page {i+1} at {size.width}x{size.height}")
-                
-                # ---- Step 3: Create preview for display ----
-                if self.captured_images:
-                    # Show first page as preview (scaled down for display)
-                    self._updatePreview(self.captured_images[0])
-                    self.statusLabel.setStringValue_(
-                        f"Scanned {len(self.captured_images)} page(s) successfully!"
-                    )
-                    self.saveButton.setEnabled_(True)
-                    self.convertToPngButton.setEnabled_(True)  # Enable PDF to PNG conversion
-            else:
-                logging.warning("Could not create PDFDocument from data")
-                # Fallback: Save raw PDF directly
-                self._saveRawPDF(pdf_data)
-        
-        else:
-            # ---- Fallback: Try to get individual images ----
-            debug_info += "No PDF found, trying image formats...\n"
-            logging.info("No PDF data found, trying image formats")
-            
-            # Try different image formats in order of preference
-            image_types = [
-                NSPasteboardTypeTIFF,  # TIFF can contain multiple images
-                NSPasteboardTypePNG,   # Lossless compression
-                'public.tiff',
-                'public.png',
-                'public.jpeg',         # Lossy but common
-                'public.image'         # Generic image type
-            ]
-            
-            for img_type in image_types:
-                if img_type in types:
-                    data = pasteboard.dataForType_(img_type)
-                    if data:
-                        image = NSImage.alloc().initWithData_(data)
-                        if image:
-                            # Configure for maximum quality
-                            image.setCacheMode_(0)  # Don't cache, always use original
-                            image.setScalesWhenResized_(False)  # Preserve resolution
-                            
-                            self.captured_images.append(image)
-                            debug_info += f"Found image type: {img_type}\n"
-                            
-                            # Get actual resolution information
-                            reps = image.representations()
-                            if reps:
-                                rep = reps[0]
-                                if hasattr(rep, 'pixelsWide'):
-                                    width = rep.pixelsWide()
-                                    height = rep.pixelsHigh()
-                                    debug_info += f"  Resolution: {width}x{height}\n"
-                                    logging.info(f"Image resolution: {width}x{height}")
-            
-            if self.captured_images:
-                self._updatePreview(self.captured_images[0])
-                self.statusLabel.setStringValue_(
-                    f"Captured {len(self.captured_images)} image(s)"
-                )
-                self.saveButton.setEnabled_(True)
-                # Don't enable convert button for individual images (only for PDFs)
-                self.convertToPngButton.setEnabled_(False)
-        
-        # Display debug information if in debug mode
-        if config.debug_mode:
-            self.textView.setString_(debug_info)
+    # 8 bits per component; bytesPerRow=0 lets Quartz pick the row alignment
+    color_space = QZ.CGColorSpaceCreateDeviceRGB()
+    context = QZ.CGBitmapContextCreate(
+        None, width, height, 8, 0, color_space,
+        QZ.kCGImageAlphaPremultipliedFirst
+    )
+    
+    # Scale before drawing so Quartz renders the page at full resolution
+    QZ.CGContextScaleCTM(context, scale, scale)
+    
+    # Move the media box origin to the corner of the bitmap and draw
+    QZ.CGContextTranslateCTM(context, -media_box.origin.x, -media_box.origin.y)
+    QZ.CGContextDrawPDFPage(context, page_ref)
+    
+    return QZ.CGBitmapContextCreateImage(context)
+
+
+def _render_pdf_page(page, scale):
+    """
+    Rasterize a PDF page into an NSBitmapImageRep (see _rasterize_pdf_page).
+    
+    Args:
+        page: PDFPage to render
+        scale: Resolution scale factor (1.0 = 72 DPI)
         
-        logging.info(f"Capture complete: {len(self.captured_images)} images")
-        return len(self.captured_images) > 0 or self.captured_data is not None
+    Returns:
+        NSBitmapImageRep containing the rendered page
+    """
+    cg_image = _rasterize_pdf_page(page, scale)
+    return AK.NSBitmapImageRep.alloc().initWithCGImage_(cg_image)
+
+
+def _export_pdf_page(page, filepath, fmt, rep=None):
+    """
+    Save a single PDF page as an image file.
     
-    def _updatePreview(self, original_image=None):
-        """
-        Update the preview image view with a scaled version.
+    If the page was already rasterized at capture time, that bitmap is
+    encoded as-is. Otherwise the page is drawn once with Quartz (the same
+    renderer Save All Pages uses) and handed to ImageIO. Safe to run on
+    worker threads.
+    
+    Args:
+        page: PDFPage to export
+        filepath: Path object for output file
+        fmt: OutputFormat to save as (PNG, JPEG or TIFF)
+        rep: Optional NSBitmapImageRep already rendered for this page
         
-        Args:
-            original_image: The full-resolution NSImage to preview
-        """
-        if not original_image:
-            return
-        # Create a preview-sized version for display
-        preview_image = NSImage.alloc().initWithSize_(NSMakeSize(660, 850))
-        preview_image.lockFocus()
-        original_image.drawInRect_fromRect_operation_fraction_(
-            NSMakeRect(0, 0, 660, 850),
-            NSMakeRect(0, 0, original_image.size().width, original_image.size().height),
-            1,  # NSCompositingOperationCopy
-            1.0  # Full opacity
-        )
-        preview_image.unlockFocus()
-        self.imageView.setImage_(preview_image)
+    Returns:
+        bool: True if saved successfully
+    """
+    if rep is not None:
+        # Hand the rep's backing CGImage to ImageIO: no re-render, no copy
+        return _write_cgimage(rep.CGImage(), filepath, fmt)
+    cg_image = _rasterize_pdf_page(page, config.resolution_scale)
+    return bool(cg_image) and _write_cgimage(cg_image, filepath, fmt)
+
+
+# ================================
+# Image Export
+# ================================
+
+def _export_base_name():
+    """
+    Build the common file name stem for one save operation.
     
-    def _saveRawPDF(self, pdf_data=None):
-        """
-        Save raw PDF data directly to file.
+    Called once per batch, so every file of a multi-page export shares the
+    same timestamp even if saving takes longer than a second.
+    
+    Returns:
+        str: e.g. 'scanned_document_20240131_142501'
+    """
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return f"{config.filename_prefix}_{timestamp}"
+
+
+def _page_stem(base_name, page_num):
+    """
+    File name of a single page of an export, without the extension.
+    
+    Args:
+        base_name: Stem from _export_base_name()
+        page_num: One-based page number
         
-        Args:
-            pdf_data: NSData containing PDF content
-        """
-        if not pdf_data:
-            return
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        pdf_filename = f"{config.filename_prefix}_{timestamp}.pdf"
-        pdf_filepath = config.output_dir / pdf_filename
+    Returns:
+        str: e.g. 'scanned_document_20240131_142501_page01'
+    """
+    return f"{base_name}_page{page_num:02d}"
+
+
+def _page_filename(base_name, page_num, fmt):
+    """
+    File name for a single page of an export.
+    
+    Args:
+        base_name: Stem from _export_base_name()
+        page_num: One-based page number
+        fmt: OutputFormat of the file
         
-        if pdf_data.writeToFile_atomically_(str(pdf_filepath), True):
-            logging.info(f"Saved raw PDF: {pdf_filepath}")
-            self.statusLabel.setStringValue_(f"PDF saved: {pdf_filename}")
+    Returns:
+        str: e.g. 'scanned_document_20240131_142501_page01.png'
+    """
+    return f"{_page_stem(base_name, page_num)}.{fmt.extension}"
+
+
+def _write_data(data, filepath):
+    """
+    Write NSData to disk without copying it into Python.
     
-    def showContinuityMenu_(self, sender):
-        """
-        Display the Continuity Camera context menu.
+    The pasteboard and the image encoders hand us NSData objects. Converting
+    them with bytes() would memcpy the whole (often multi-megabyte) buffer
+    into a Python object just to write it out again, so the write is left to
+    Foundation, which streams the existing buffer straight to the file.
+    
+    The write is atomic (temporary file plus rename), so quitting in the
+    middle of an export never leaves a truncated file under its final name.
+    
+    The URL-based write replaces the deprecated writeToFile:atomically: and
+    reports why a write failed instead of just returning NO.
+    
+    Args:
+        data: NSData to write
+        filepath: Path object for output file
         
-        This triggers the system menu that shows available iOS devices
-        for scanning. The actual menu items are populated by macOS
-        based on nearby devices.
+    Returns:
+        bool: True if saved successfully
+    """
+    ok, error = data.writeToURL_options_error_(
+        _file_url()(str(filepath)), FN.NSDataWritingAtomic, None
+    )
+    if not ok:
+        log.error(f"Could not write {filepath}: {error.localizedDescription()}")
+    return bool(ok)
+
+
+def _partial_path(filepath):
+    """
+    Temporary name an encoder writes to before the file is published.
+    
+    ImageIO writes its output in place, so it is pointed at this name and
+    _publish_partial() renames the finished file, the same way an atomic
+    NSData write does.
+    
+    Args:
+        filepath: Path object for the final output file
         
-        Args:
-            sender: The button that triggered this action
-        """
-        logging.info("Showing Continuity Camera menu...")
+    Returns:
+        str: Path of the temporary file, e.g. 'name_page01.part.png'
+    """
+    # Keep the extension last so the file type stays recognizable
+    root, ext = os.path.splitext(str(filepath))
+    return f"{root}.part{ext}"
+
+
+def _publish_partial(partial, filepath, ok):
+    """
+    Move a finished temporary file into place, or discard a failed one.
+    
+    Args:
+        partial: Path from _partial_path()
+        filepath: Path object for the final output file
+        ok: Whether the encoder succeeded
         
-        # Make this view the first responder to receive data
-        window = self.view().window()
-        if window:
-            window.makeFirstResponder_(self)
+    Returns:
+        bool: True if the file is now in place
+    """
+    try:
+        if ok:
+            os.replace(partial, filepath)
+            return True
+        os.unlink(partial)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        log.error(f"Could not write {filepath}: {e}")
+    return False
+
+
+def _run_parallel(func, jobs):
+    """
+    Call ``func(*job)`` for every job, spreading the work over CPU cores.
+    
+    Image encoding happens inside libpng/libjpeg/libtiff and PyObjC releases
+    the GIL around Objective-C calls, so independent encode-and-write jobs
+    scale across cores with plain threads. Each job gets its own autorelease
+    pool, because worker threads have none of their own.
+    
+    Args:
+        func: Callable to run; must not share mutable state between jobs
+        jobs: List of argument tuples, one per call
         
-        # Create or get the menu
-        menu = sender.menu()
-        if not menu:
-            menu = NSMenu.alloc().init()
-            sender.setMenu_(menu)
+    Returns:
+        list: The results, in the same order as ``jobs``
+    """
+    def run(job):
+        with objc.autorelease_pool():
+            return func(*job)
+    
+    # A pool is not worth starting for a single job
+    if len(jobs) < 2:
+        return [run(job) for job in jobs]
+    
+    workers = min(len(jobs), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(run, jobs))
+
+
+def _write_cgimage(cg_image, filepath, fmt):
+    """
+    Encode a CGImage straight to a file with ImageIO.
+    
+    This needs no AppKit objects: the CGImage is handed to a
+    CGImageDestination, which encodes it with the prebuilt properties from
+    Config.finalize and writes the file in one step, without an
+    intermediate NSData copy. The file is encoded under a temporary name
+    and renamed into place once complete.
+    
+    Args:
+        cg_image: CGImage to save
+        filepath: Path object for output file
+        fmt: OutputFormat to save as (PNG, JPEG or TIFF)
         
-        # Show menu at current mouse position
-        event = NSApp.currentEvent()
-        if event:
-            self.statusLabel.setStringValue_("Select 'Scan Documents' from your iPhone...")
-            NSMenu.popUpContextMenu_withEvent_forView_(menu, event, sender)
+    Returns:
+        bool: True if saved successfully
+    """
+    partial = _partial_path(filepath)
+    url = _file_url()(partial)
+    destination = QZ.CGImageDestinationCreateWithURL(url, fmt.spec.uti, 1, None)
+    if destination is None:
+        return False
     
-    def saveAllDocuments_(self, sender):
+    QZ.CGImageDestinationAddImage(
+        destination, cg_image, config.destination_properties[fmt]
+    )
+    ok = bool(QZ.CGImageDestinationFinalize(destination))
+    return _publish_partial(partial, filepath, ok)
+
+
+# ================================
+# Cocoa Controllers
+# ================================
+
+# Names of the PyObjC classes created by _load_cocoa_classes(); the module
+# level __getattr__ builds them on demand when accessed from outside.
+_COCOA_CLASS_NAMES = (
+    'ContinuityCameraViewController',
+    'ContinuityCameraWindowController',
+)
+
+
+# User defaults key under which AppKit remembers the main window's frame
+_WINDOW_AUTOSAVE_NAME = "iPhoneScanMainWindow"
+
+
+def _load_cocoa_classes():
+    """
+    Define the Objective-C controller subclasses on first use.
+    
+    PyObjC subclasses need their AppKit base classes at class creation time,
+    so defining them at module level would import AppKit on every start -
+    even for --help. Wrapping the definitions in a function keeps the
+    command-line paths free of PyObjC; the classes are published as module
+    globals the first time the GUI is started.
+    
+    Note: Objective-C class names are global to the process, so the classes
+    must only ever be registered once.
+    """
+    global ContinuityCameraViewController, ContinuityCameraWindowController
+    
+    if 'ContinuityCameraWindowController' in globals():
+        return
+    
+    # ================================
+    # View Controller Implementation
+    # ================================
+
+    class ContinuityCameraViewController(AK.NSViewController):
         """
-        Save all captured documents in configured formats.
-        
-        This method saves documents in multiple formats based on
-        configuration settings. It demonstrates:
-        - File I/O operations
-        - Image format conversion
-        - Bitmap representation handling
-        
-        Args:
-            sender: The button that triggered this action
+        View Controller for Continuity Camera functionality.
+        
+        This class manages the user interface and handles the interaction
+        with iOS devices through the Continuity Camera feature. It demonstrates:
+        - Creating UI elements programmatically using AppKit
+        - Handling pasteboard (clipboard) data transfer
+        - Processing multi-page PDF documents
+        - Converting between image formats
+        
+        Attributes:
+            imageView: Preview display for scanned documents
+            statusLabel: Status message display
+            captureButton: Initiates document scanning
+            saveButton: Saves captured documents
+            debugButton: Shows pasteboard contents (educational)
+            scrollView: Container for debug output
+            textView: Debug information display
+            captured_data: Raw PDF data from scanner
+            captured_pdf_doc: PDFDocument parsed from captured_data
+            captured_images: List of processed images (NSBitmapImageRep for
+                rendered PDF pages, NSImage for pasteboard images)
+            captured_raw: Parallel to captured_images: (OutputFormat, NSData)
+                of the original pasteboard bytes, or None if not applicable
+            debug_report: Last pasteboard debug report
+            debug_change_count: Pasteboard changeCount the report was built for
         """
-        if not self.captured_images and not self.captured_data:
-            logging.warning("No documents to save")
-            return
         
-        logging.info("Saving documents...")
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        files_saved = []
+        # Instance variables (ivars) - Objective-C style property declarations
+        imageView = objc.ivar()
+        statusLabel = objc.ivar()
+        captureButton = objc.ivar()
+        saveButton = objc.ivar()
+        convertToPngButton = objc.ivar()
+        debugButton = objc.ivar()
+        scrollView = objc.ivar()
+        textView = objc.ivar()
+        captured_data = objc.ivar()
+        captured_pdf_doc = objc.ivar()
+        captured_images = objc.ivar()
+        captured_raw = objc.ivar()
+        debug_report = objc.ivar()
+        debug_change_count = objc.ivar()
+        converting = objc.ivar()
+        
+        def init(self):
+            """
+            Initialize the view controller.
+            
+            This method is called when the object is created. It sets up
+            initial state before the view is loaded.
+            
+            Returns:
+                self: The initialized instance
+            """
+            # Call parent class initializer
+            self = objc.super(ContinuityCameraViewController, self).init()
+            if self:
+                self.captured_data = None
+                self.captured_pdf_doc = None
+                self.captured_images = []
+                self.captured_raw = []
+                self.debug_report = None
+                self.debug_change_count = None
+                self.converting = False
+                log.debug("ContinuityCameraViewController initialized")
+            return self
         
-        # ---- Save PDF if available and requested ----
-        if self.captured_data and OutputFormat.PDF in config.output_formats:
-            pdf_filename = f"{config.filename_prefix}_{timestamp}.pdf"
-            pdf_filepath = config.output_dir / pdf_filename
+        def loadView(self):
+            """
+            Create and configure the user interface.
+            
+            This method builds the UI programmatically using a vertical stack view
+            layout. Each UI element is created, configured, and added to the view
+            hierarchy.
+            
+            The UI consists of:
+            - Status label for user feedback
+            - Image view for document preview
+            - Debug text area (educational feature)
+            - Control buttons for scanning and saving
+            """
+            log.debug("Loading view...")
+            
+            # Create main container view with specified dimensions
+            frame = AK.NSMakeRect(0, 0, 700, 600)
+            self.setView_(AK.NSStackView.alloc().initWithFrame_(frame))
+            view = self.view()
+            
+            # Configure stack view for vertical layout with spacing
+            view.setOrientation_(AK.NSUserInterfaceLayoutOrientationVertical)
+            view.setSpacing_(20)  # Pixels between elements
+            view.setEdgeInsets_((20, 20, 20, 20))  # Top, right, bottom, left padding
+            
+            # ---- Status Label ----
+            # Provides feedback to the user about current operations
+            self.statusLabel = AK.NSTextField.alloc().initWithFrame_(AK.NSMakeRect(0, 0, 660, 30))
+            self.statusLabel.setStringValue_("Click 'Scan Document' to start scanning with your iPhone")
+            self.statusLabel.setEditable_(False)  # Read-only
+            self.statusLabel.setBordered_(False)  # No border
+            self.statusLabel.setBackgroundColor_(None)  # Transparent background
+            self.statusLabel.setAlignment_(AK.NSTextAlignmentCenter)
+            self.statusLabel.setFont_(AK.NSFont.systemFontOfSize_(14))
+            
+            # ---- Image View ----
+            # Displays preview of scanned documents
+            self.imageView = AK.NSImageView.alloc().initWithFrame_(AK.NSMakeRect(0, 0, 660, 350))
+            # NSImageScaleProportionallyDown = 3: Scale down only if needed, maintaining aspect ratio
+            self.imageView.setImageScaling_(3)
+            self.imageView.setImageFrameStyle_(2)  # Adds a decorative frame
+            
+            # ---- Debug Text View ----
+            # Educational feature: shows pasteboard contents for learning
+            self.scrollView = AK.NSScrollView.alloc().initWithFrame_(AK.NSMakeRect(0, 0, 660, 100))
+            self.textView = AK.NSTextView.alloc().initWithFrame_(AK.NSMakeRect(0, 0, 660, 100))
+            self.textView.setEditable_(False)
+            self.textView.setRichText_(False)  # Plain text only
+            self.scrollView.setDocumentView_(self.textView)
+            self.scrollView.setHasVerticalScroller_(True)
+            
+            # ---- Capture Button ----
+            # Triggers the Continuity Camera menu
+            self.captureButton = AK.NSButton.alloc().initWithFrame_(AK.NSMakeRect(0, 0, 200, 40))
+            self.captureButton.setTitle_("Scan Document")
+            self.captureButton.setTarget_(self)  # This object handles the action
+            self.captureButton.setAction_(objc.selector(self.showContinuityMenu_, signature=b'v@:@'))
+            self.captureButton.setBezelStyle_(1)  # Standard push button style
+            
+            # ---- Save Button ----
+            # Saves captured documents to disk
+            self.saveButton = AK.NSButton.alloc().initWithFrame_(AK.NSMakeRect(0, 0, 200, 40))
+            self.saveButton.setTitle_("Save All Pages")
+            self.saveButton.setTarget_(self)
+            self.saveButton.setAction_(objc.selector(self.saveAllDocuments_, signature=b'v@:@'))
+            self.saveButton.setBezelStyle_(1)
+            self.saveButton.setEnabled_(False)  # Disabled until documents are captured
+            
+            # ---- Convert to PNG Button ----
+            # Converts PDF pages to PNG format
+            self.convertToPngButton = AK.NSButton.alloc().initWithFrame_(AK.NSMakeRect(0, 0, 200, 40))
+            self.convertToPngButton.setTitle_("Convert PDF to PNG")
+            self.convertToPngButton.setTarget_(self)
+            self.convertToPngButton.setAction_(objc.selector(self.convertPdfToPng_, signature=b'v@:@'))
+            self.convertToPngButton.setBezelStyle_(1)
+            self.convertToPngButton.setEnabled_(False)  # Disabled until PDF is captured
+            
+            # ---- Debug Button ----
+            # Educational: shows what data types are available in pasteboard
+            self.debugButton = AK.NSButton.alloc().initWithFrame_(AK.NSMakeRect(0, 0, 200, 40))
+            self.debugButton.setTitle_("Debug Pasteboard")
+            self.debugButton.setTarget_(self)
+            self.debugButton.setAction_(objc.selector(self.debugPasteboard_, signature=b'v@:@'))
+            self.debugButton.setBezelStyle_(1)
+            
+            # Add UI elements to main view
+            view.addArrangedSubview_(self.statusLabel)
+            view.addArrangedSubview_(self.imageView)
+            
+            # Only show debug area if debug mode is enabled
+            if config.debug_mode:
+                view.addArrangedSubview_(self.scrollView)
             
-            if self.captured_data.writeToFile_atomically_(str(pdf_filepath), True):
-                files_saved.append(str(pdf_filepath))
-                logging.info(f"Saved PDF: {pdf_filepath}")
+            # Create horizontal container for buttons
+            buttonContainer = AK.NSStackView.alloc().init()
+            buttonContainer.setOrientation_(0)  # 0 = Horizontal orientation
+            buttonContainer.setSpacing_(20)
+            buttonContainer.addArrangedSubview_(self.captureButton)
+            buttonContainer.addArrangedSubview_(self.saveButton)
+            buttonContainer.addArrangedSubview_(self.convertToPngButton)
+            
+            if config.debug_mode:
+                buttonContainer.addArrangedSubview_(self.debugButton)
+            
+            view.addArrangedSubview_(buttonContainer)
+            
+            log.debug("View loaded successfully")
         
-        # ---- Save individual images in requested formats ----
-        for i, image in enumerate(self.captured_images):
-            page_num = i + 1
-            
-            # Find the highest resolution representation
-            best_rep = self._getBestImageRep(image)
-            
-            if best_rep:
-                # Save in each requested format
-                for fmt in config.output_formats:
-                    if fmt == OutputFormat.PDF:
-                        continue  # Already handled above
-                    
-                    filename = f"{config.filename_prefix}_{timestamp}_page{page_num:02d}.{fmt.value}"
-                    filepath = config.output_dir / filename
+        def validRequestorForSendType_returnType_(self, sendType, returnType):
+            """
+            Declare what data types this view can accept.
+            
+            This method is part of the NSServicesRequests protocol. It tells
+            the system that this view controller can accept data from other
+            applications or services.
+            
+            Args:
+                sendType: The type of data to send (not used here)
+                returnType: The type of data we can receive
+                
+            Returns:
+                self if we can handle the returnType, otherwise delegates to parent
+            """
+            if returnType:
+                # We accept any return type (images, PDFs, etc.)
+                return self
+            return objc.super(ContinuityCameraViewController, self).validRequestorForSendType_returnType_(
+                sendType, returnType
+            )
+        
+        def debugPasteboard_(self, sender):
+            """
+            Educational method: Display pasteboard contents for debugging.
+            
+            This method inspects the general pasteboard (clipboard) and shows
+            all available data types and their sizes. This is useful for
+            understanding how data is transferred between applications in macOS.
+            
+            Args:
+                sender: The button that triggered this action
+            """
+            log.debug("Debugging pasteboard...")
+            
+            # Get the general pasteboard (system clipboard)
+            pb = _general_pasteboard()
+            
+            # changeCount goes up every time the pasteboard contents change.
+            # If it has not moved since the last inspection, the previous
+            # report is still accurate and nothing needs to be re-read.
+            change_count = pb.changeCount()
+            if self.debug_report is not None and change_count == self.debug_change_count:
+                self.textView.setString_(self.debug_report)
+                log.info(self.debug_report)
+                return
+            
+            types = pb.types()
+            
+            # Collect the report in a list and join it once at the end
+            debug_parts = [
+                "=== Pasteboard Debug Info ===\n",
+                f"Available types: {len(types)}\n\n",
+            ]
+            
+            # Iterate through all data types in pasteboard
+            for type_str in types:
+                debug_parts.append(f"Type: {type_str}\n")
+                
+                # Only the size is reported, so release each blob (possibly a
+                # multi-megabyte PDF) right away instead of keeping every type's
+                # data alive until the end of the event loop iteration
+                with objc.autorelease_pool():
+                    data = pb.dataForType_(type_str)
+                    size = data.length() if data else 0
+                    data = None
+                
+                if size:
+                    debug_parts.append(f"  Data size: {size} bytes\n")
                     
-                    if self._saveImageRep(best_rep, filepath, fmt):
-                        files_saved.append(str(filepath))
-                        logging.info(f"Saved {fmt.value.upper()}: {filepath}")
-        
-        # Update status
-        self.statusLabel.setStringValue_(f"Saved {len(files_saved)} file(s)")
-        logging.info(f"Save complete: {len(files_saved)} files")
-        
-        # Print file list if verbose
-        if config.verbose and not config.quiet:
-            print("\nSaved files:")
-            for f in files_saved:
-                print(f"  - {f}")
-        
-        # Open in Preview if requested
-        if config.open_in_preview and files_saved:
-            self._openInPreview(files_saved)
-    
-    def convertPdfToPng_(self, sender):
-        """
-        Convert all PDF pages to individual PNG files.
-        
-        This method takes the captured PDF data and saves each page as a
-        high-resolution PNG file. It's useful for users who need individual
-        image files from a multi-page PDF scan.
-        
-        Args:
-            sender: The button that triggered this action
-        """
-        if not self.captured_data:
-            logging.warning("No PDF data to convert")
-            self.statusLabel.setStringValue_("No PDF data available for conversion")
-            return
+                    # Identify common data types for educational purposes
+                    label = _debug_type_label(type_str)
+                    if label:
+                        debug_parts.append(label)
+                debug_parts.append("\n")
             
-        logging.info("Converting PDF pages to PNG format...")
-        self.statusLabel.setStringValue_("Converting PDF pages to PNG...")
-        
-        # Create PDFDocument from captured data
-        pdf_doc = PDFDocument.alloc().initWithData_(self.captured_data)
-        if not pdf_doc:
-            logging.error("Failed to create PDF document for conversion")
-            self.statusLabel.setStringValue_("Error: Could not process PDF")
-            return
+            debug_info = "".join(debug_parts)
+            self.debug_report = debug_info
+            self.debug_change_count = change_count
             
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        files_saved = []
-        page_count = pdf_doc.pageCount()
-        
-        logging.info(f"Converting {page_count} PDF page(s) to PNG...")
+            # Display in UI and console
+            self.textView.setString_(debug_info)
+            log.info(debug_info)
         
-        # Process each page
-        for i in range(page_count):
-            page = pdf_doc.pageAtIndex_(i)
-            if page:
-                # Get page dimensions
-                bounds = page.boundsForBox_(0)  # Media box
+        def readSelectionFromPasteboard_(self, pasteboard):
+            """
+            Read and process scanned documents from the pasteboard.
+            
+            This is the core method that handles data transfer from the iPhone
+            scanner. It demonstrates:
+            1. Reading different data formats from pasteboard
+            2. PDF processing for multi-page documents
+            3. High-resolution image extraction
+            4. Format conversion
+            
+            Args:
+                pasteboard: The NSPasteboard containing scanned data
                 
-                # Create high-resolution image
-                scale_factor = config.resolution_scale
-                size = NSMakeSize(
-                    bounds.size.width * scale_factor,
-                    bounds.size.height * scale_factor
-                )
+            Returns:
+                bool: True if data was successfully read, False otherwise
+            """
+            with _user_activity("Reading scanned documents"):
+                log.info("Reading data from pasteboard...")
                 
-                # Create NSImage and render PDF page
-                image = NSImage.alloc().initWithSize_(size)
-                image.lockFocus()
+                # The debug report is only shown in debug mode; skip building it
+                # (including the costly repr of the types array) otherwise
+                debug = config.debug_mode
+                debug_parts = ["=== Reading from Pasteboard ===\n"]
+                types = pasteboard.types()
+                # Bridge the type names to Python once: set lookups are O(1) and
+                # no longer cross into Objective-C for every comparison
+                available_types = frozenset(str(t) for t in types)
+                if debug:
+                    debug_parts.append(f"Available types: {types}\n\n")
                 
-                # Apply scaling
-                transform = objc.lookUpClass('NSAffineTransform').transform()
-                transform.scaleBy_(scale_factor)
-                transform.concat()
+                # Reset captured data
+                self.captured_images = []
+                self.captured_raw = []
+                self.captured_data = None
+                self.captured_pdf_doc = None
                 
-                # Render the page
-                page.drawWithBox_(0)
-                image.unlockFocus()
+                # ---- Step 1: Try to get PDF data (preferred for multi-page) ----
+                # PDF is the best format as it preserves vector graphics and can
+                # contain multiple pages in a single file
+                pdf_data = None
                 
-                # Get bitmap representation or create one
-                best_rep = self._getBestImageRep(image)
-                if not best_rep:
-                    # If no bitmap rep exists, create one from the image
-                    data = image.TIFFRepresentation()
-                    if data:
-                        best_rep = NSBitmapImageRep.imageRepWithData_(data)
+                # Take the first PDF type offered: the others are renditions of
+                # the same document, and each fetch copies the whole blob
+                for pdf_type in _PDF_PASTEBOARD_TYPES:
+                    if pdf_type in available_types:
+                        pdf_data = pasteboard.dataForType_(pdf_type)
+                        if pdf_data:
+                            break
                 
-                if best_rep:
-                    # Save as PNG
-                    page_num = i + 1
-                    filename = f"{config.filename_prefix}_{timestamp}_page{page_num:02d}.png"
-                    filepath = config.output_dir / filename
+                if pdf_data:
+                    pdf_size = pdf_data.length()
+                    if debug:
+                        debug_parts.append(f"Found PDF data of size: {pdf_size} bytes\n")
+                    log.info(f"Retrieved PDF data: {pdf_size} bytes")
                     
-                    # Generate PNG data
-                    data = best_rep.representationUsingType_properties_(
-                        NSBitmapImageFileTypePNG, {}
+                    # Store raw PDF for later saving
+                    self.captured_data = pdf_data
+                
+                if pdf_data and pdf_size > config.max_pasteboard_bytes:
+                    # Too large to parse and render: PDFDocument and page
+                    # rendering would need several more copies of it. The scan
+                    # is kept, so Save All Pages can still write it as a PDF.
+                    log.warning(
+                        f"PDF data too large to process ({pdf_size} bytes, limit "
+                        f"{config.max_pasteboard_bytes} bytes): keeping the raw PDF only"
                     )
-                    
-                    if data and data.writeToFile_atomically_(str(filepath), True):
-                        files_saved.append(str(filepath))
-                        logging.info(f"Saved PNG: {filepath}")
+                    self.statusLabel.setStringValue_(
+                        "Scanned PDF is too large to preview; Save All Pages saves it as PDF"
+                    )
+                    self.saveButton.setEnabled_(True)
+                    self.convertToPngButton.setEnabled_(False)
+                
+                elif pdf_data:
+                    # ---- Step 2: Extract pages from PDF ----
+                    # PDFDocument is part of the Quartz framework
+                    pdf_doc = QZ.PDFDocument.alloc().initWithData_(pdf_data)
+                    # Keep the parsed document so a later conversion can reuse it
+                    self.captured_pdf_doc = pdf_doc
+                    if pdf_doc:
+                        page_count = pdf_doc.pageCount()
+                        if debug:
+                            debug_parts.append(f"PDF has {page_count} pages\n")
+                        log.info(f"Processing {page_count} page(s) from PDF")
+                        
+                        # The pages are not rasterized here: that only happens
+                        # when they are saved as images (see _rasterizeAllPages),
+                        # and the preview is drawn from the PDF page itself
                         
-                        # Update status for each page
+                        # ---- Step 3: Create preview for display ----
+                        first_page = pdf_doc.pageAtIndex_(0) if page_count else None
+                        if first_page:
+                            # Render the first page straight at preview size
+                            self._updatePreview(first_page)
+                            self.statusLabel.setStringValue_(
+                                f"Scanned {page_count} page(s) successfully!"
+                            )
+                            self.saveButton.setEnabled_(True)
+                            # Enable PDF to PNG conversion (unless one is still running)
+                            self.convertToPngButton.setEnabled_(not self.converting)
+                    else:
+                        log.warning("Could not create PDFDocument from data")
+                        # Fallback: Save raw PDF directly
+                        self._saveRawPDF(pdf_data)
+                
+                else:
+                    # ---- Fallback: Try to get individual images ----
+                    if debug:
+                        debug_parts.append("No PDF found, trying image formats...\n")
+                    log.info("No PDF data found, trying image formats")
+                    
+                    # Try different image formats in order of preference
+                    for img_type in _IMAGE_PASTEBOARD_TYPES:
+                        if img_type in available_types:
+                            data = pasteboard.dataForType_(img_type)
+                            if data:
+                                image = AK.NSImage.alloc().initWithData_(data)
+                                if image:
+                                    # Configure for maximum quality
+                                    image.setCacheMode_(0)  # Don't cache, always use original
+                                    image.setScalesWhenResized_(False)  # Preserve resolution
+                                    
+                                    self.captured_images.append(image)
+                                    # Keep the original bytes: if they already are
+                                    # in a requested format they are saved as-is
+                                    source_format = _UTI_FORMATS.get(img_type)
+                                    self.captured_raw.append(
+                                        (source_format, data) if source_format is not None else None
+                                    )
+                                    if debug:
+                                        debug_parts.append(f"Found image type: {img_type}\n")
+                                    
+                                    # Get actual resolution information
+                                    reps = image.representations()
+                                    if reps:
+                                        rep = reps[0]
+                                        if hasattr(rep, 'pixelsWide'):
+                                            width = rep.pixelsWide()
+                                            height = rep.pixelsHigh()
+                                            if debug:
+                                                debug_parts.append(f"  Resolution: {width}x{height}\n")
+                                            log.info(f"Image resolution: {width}x{height}")
+                    
+                    if self.captured_images:
+                        self._updatePreview(self.captured_images[0])
                         self.statusLabel.setStringValue_(
-                            f"Converting PDF to PNG: {page_num}/{page_count} pages..."
+                            f"Captured {len(self.captured_images)} image(s)"
                         )
-        
-        # Final status update
-        if files_saved:
-            self.statusLabel.setStringValue_(
-                f"Successfully converted {len(files_saved)} page(s) to PNG"
-            )
-            logging.info(f"PDF to PNG conversion complete: {len(files_saved)} files")
+                        self.saveButton.setEnabled_(True)
+                        # Don't enable convert button for individual images (only for PDFs)
+                        self.convertToPngButton.setEnabled_(False)
+                
+                # Display debug information if in debug mode
+                if debug:
+                    self.textView.setString_("".join(debug_parts))
+                
+                if self.captured_pdf_doc:
+                    log.info(f"Capture complete: {self.captured_pdf_doc.pageCount()} PDF page(s)")
+                else:
+                    log.info(f"Capture complete: {len(self.captured_images)} images")
+                return len(self.captured_images) > 0 or self.captured_data is not None
+        
+        # Helpers that are only ever called from Python are marked
+        # python_method: PyObjC then does not register them as Objective-C
+        # selectors, and calling them stays a plain Python call instead of
+        # a round trip through the bridge.
+        @objc.python_method
+        def _rasterizeAllPages(self):
+            """
+            Render the captured PDF's pages into captured_images on demand.
             
-            # Print file list if verbose
-            if config.verbose and not config.quiet:
-                print(f"\nConverted {len(files_saved)} PDF pages to PNG:")
-                for f in files_saved:
-                    print(f"  - {f}")
+            Rasterizing at resolution_scale costs tens of megabytes per page,
+            so it is deferred until images are actually saved and then done
+            once; later saves and conversions reuse the bitmaps.
             
-            # Open in Preview if configured
-            if config.open_in_preview:
-                self._openInPreview(files_saved)
-        else:
-            self.statusLabel.setStringValue_("Error: No pages could be converted")
-            logging.error("Failed to convert any PDF pages to PNG")
-    
-    def _openInPreview(self, file_paths=None):
-        """
-        Open saved files in Preview app.
-        
-        Args:
-            file_paths: List of file paths to open
-        """
-        if not file_paths:
-            return
+            Returns:
+                list: captured_images (NSBitmapImageRep per rendered page)
+            """
+            pdf_doc = self.captured_pdf_doc
+            if self.captured_images or not pdf_doc:
+                return self.captured_images
             
-        logging.info(f"Opening {len(file_paths)} file(s) in Preview...")
-        
-        # Use NSWorkspace to open files in Preview
-        workspace = NSWorkspace.sharedWorkspace()
-        
-        # Convert file paths to NSURL objects
-        urls = [NSURL.fileURLWithPath_(str(path)) for path in file_paths]
-        
-        # Open all files with Preview app
-        success = workspace.openURLs_withAppBundleIdentifier_options_additionalEventParamDescriptor_launchIdentifiers_(
-            urls,
-            "com.apple.Preview",  # Preview's bundle identifier
-            0,  # NSWorkspaceLaunchDefault
-            None,
-            None
-        )
-        
-        if success:
-            logging.info("Files opened in Preview successfully")
-            self.statusLabel.setStringValue_(f"Saved {len(file_paths)} file(s) - Opened in Preview")
-        else:
-            logging.error("Failed to open files in Preview")
-    
-    def _getBestImageRep(self, image=None):
-        """
-        Find the highest resolution bitmap representation of an image.
-        
-        Args:
-            image: NSImage to process
+            # Collect the pages on the main thread; the rasterization
+            # itself is pure Core Graphics and runs on worker threads
+            page_at = pdf_doc.pageAtIndex_
+            pages = [page_at(i) for i in range(pdf_doc.pageCount())]
+            scale = config.resolution_scale
+            jobs = [(page, scale) for page in pages if page]
             
-        Returns:
-            NSBitmapImageRep with highest resolution, or None
-        """
-        if not image:
-            return None
-        best_rep = None
-        max_pixels = 0
-        
-        for rep in image.representations():
-            if rep.isKindOfClass_(NSBitmapImageRep):
-                pixels = rep.pixelsWide() * rep.pixelsHigh()
-                if pixels > max_pixels:
-                    max_pixels = pixels
-                    best_rep = rep
+            # ---- High-Resolution Rendering ----
+            # Rasterize every page directly at the scaled resolution
+            # for better quality when saving as images
+            reps = _run_parallel(_render_pdf_page, jobs)
+            
+            # Only ask every page for its size if it is going to be logged
+            if log.isEnabledFor(logging.DEBUG):
+                for i, rep in enumerate(reps):
+                    size = rep.size()
+                    log.debug(f"Rendered page {i+1} at {size.width}x{size.height}")
+            
+            # Store the bitmaps themselves: each already is the best
+            # representation, so no NSImage wrapper is needed
+            self.captured_images = list(reps)
+            self.captured_raw = [None] * len(reps)
+            return self.captured_images
+        
+        @objc.python_method
+        def _updatePreview(self, original_image=None):
+            """
+            Update the preview image view with a scaled version.
+            
+            A PDFPage is rasterized directly at preview width, so no
+            full-resolution bitmap is needed just to show the preview.
+            
+            Args:
+                original_image: PDFPage to render, or the full-resolution
+                    NSImage to scale down (pasteboard image fallback)
+            """
+            if not original_image:
+                return
+            if original_image.isKindOfClass_(QZ.PDFPage):
+                page_width = original_image.boundsForBox_(QZ.kPDFDisplayBoxMediaBox).size.width
+                rep = _render_pdf_page(original_image, 660 / page_width)
+                preview_image = AK.NSImage.alloc().initWithSize_(rep.size())
+                preview_image.addRepresentation_(rep)
+                self.imageView.setImage_(preview_image)
+                return
+            # Create a preview-sized version for display
+            make_rect = AK.NSMakeRect
+            size = original_image.size()
+            preview_image = AK.NSImage.alloc().initWithSize_(AK.NSMakeSize(660, 850))
+            preview_image.lockFocus()
+            original_image.drawInRect_fromRect_operation_fraction_(
+                make_rect(0, 0, 660, 850),
+                make_rect(0, 0, size.width, size.height),
+                1,  # NSCompositingOperationCopy
+                1.0  # Full opacity
+            )
+            preview_image.unlockFocus()
+            self.imageView.setImage_(preview_image)
         
-        return best_rep
-    
-    def _saveImageRep(self, rep=None, filepath=None, format=None):
-        """
-        Save an image representation in the specified format.
+        @objc.python_method
+        def _saveRawPDF(self, pdf_data=None):
+            """
+            Save raw PDF data directly to file.
+            
+            Args:
+                pdf_data: NSData containing PDF content
+            """
+            if not pdf_data:
+                return
+            pdf_filename = f"{_export_base_name()}.pdf"
+            pdf_filepath = config.output_dir / pdf_filename
+            
+            if _write_data(pdf_data, pdf_filepath):
+                log.info(f"Saved raw PDF: {pdf_filepath}")
+                self.statusLabel.setStringValue_(f"PDF saved: {pdf_filename}")
         
-        Args:
-            rep: NSBitmapImageRep to save
-            filepath: Path object for output file
-            format: OutputFormat enum value
+        def showContinuityMenu_(self, sender):
+            """
+            Display the Continuity Camera context menu.
             
-        Returns:
-            bool: True if saved successfully
-        """
-        if not rep or not filepath or not format:
-            return False
-        # Map format to NSBitmapImageFileType
-        type_map = {
-            OutputFormat.PNG: NSBitmapImageFileTypePNG,
-            OutputFormat.JPEG: NSBitmapImageFileTypeJPEG,
-            OutputFormat.TIFF: NSBitmapImageFileTypeTIFF,
-        }
+            This triggers the system menu that shows available iOS devices
+            for scanning. The actual menu items are populated by macOS
+            based on nearby devices.
+            
+            Args:
+                sender: The button that triggered this action
+            """
+            log.info("Showing Continuity Camera menu...")
+            
+            # Make this view the first responder to receive data
+            window = self.view().window()
+            if window:
+                window.makeFirstResponder_(self)
+            
+            # Create or get the menu
+            menu = sender.menu()
+            if not menu:
+                menu = AK.NSMenu.alloc().init()
+                sender.setMenu_(menu)
+            
+            # Show menu at current mouse position
+            event = _shared_application().currentEvent()
+            if event:
+                self.statusLabel.setStringValue_("Select 'Scan Documents' from your iPhone...")
+                AK.NSMenu.popUpContextMenu_withEvent_forView_(menu, event, sender)
+        
+        def saveAllDocuments_(self, sender):
+            """
+            Save all captured documents in configured formats.
+            
+            This method saves documents in multiple formats based on
+            configuration settings. It demonstrates:
+            - File I/O operations
+            - Image format conversion
+            - Bitmap representation handling
+            
+            Args:
+                sender: The button that triggered this action
+            """
+            if not self.captured_images and not self.captured_data:
+                log.warning("No documents to save")
+                return
+            
+            with _user_activity("Saving scanned documents"):
+                log.info("Saving documents...")
+                # One timestamp for the whole batch keeps all file names consistent
+                base_name = _export_base_name()
+                files_saved = []
+                
+                # ---- Save PDF if available and requested ----
+                # A PDF too large to parse can only be saved as-is, so it is
+                # written even if PDF is not among the requested formats
+                if self.captured_data and (OutputFormat.PDF in config.output_formats
+                                           or not self.captured_pdf_doc):
+                    pdf_filename = f"{base_name}.pdf"
+                    pdf_filepath = config.output_dir / pdf_filename
+                    
+                    if _write_data(self.captured_data, pdf_filepath):
+                        files_saved.append(str(pdf_filepath))
+                        log.info(f"Saved PDF: {pdf_filepath}")
+                
+                # ---- Save individual images in requested formats ----
+                # Collect one job per (page, format) first...
+                jobs = []
+                raw_jobs = []
+                image_formats = config.image_formats
+                
+                # Plan the batch once: the output directory is resolved and each
+                # format's suffix built up front, so the loop only joins strings
+                output_dir = config.output_dir_str
+                suffixes = [(fmt, f".{fmt.extension}") for fmt in image_formats]
+                
+                # PDF-only output is done at this point: skip the page images.
+                # Otherwise render the PDF pages now if that has not happened yet.
+                images = self._rasterizeAllPages() if image_formats else []
+                for i, image in enumerate(images):
+                    page_stem = os.path.join(output_dir, _page_stem(base_name, i + 1))
+                    raw = self.captured_raw[i]
+                    cg_image = None
+                    
+                    # Save in each requested format (PDF was handled above)
+                    for fmt, suffix in suffixes:
+                        filepath = page_stem + suffix
+                        
+                        # Source data already in this format: write the original
+                        # bytes (ICC profile included) instead of re-encoding
+                        if raw is not None and raw[0] is fmt:
+                            raw_jobs.append((raw[1], filepath))
+                            continue
+                        
+                        # Find the highest resolution representation and fetch
+                        # its CGImage once; every format of this page shares it
+                        if cg_image is None:
+                            best_rep = self._getBestImageRep(image)
+                            if not best_rep:
+                                break
+                            cg_image = best_rep.CGImage()
+                        jobs.append((cg_image, filepath, fmt))
+                
+                # ...then encode and write the whole batch concurrently; the
+                # workers only touch CGImages and ImageIO, no AppKit objects
+                results = _run_parallel(_write_cgimage, jobs)
+                for (_, filepath, fmt), saved in zip(jobs, results):
+                    if saved:
+                        files_saved.append(str(filepath))
+                        log.info(f"Saved {fmt.name}: {filepath}")
+                
+                results = _run_parallel(_write_data, raw_jobs)
+                for (_, filepath), saved in zip(raw_jobs, results):
+                    if saved:
+                        files_saved.append(str(filepath))
+                        log.info(f"Saved original image data: {filepath}")
+                
+                # Update status
+                self.statusLabel.setStringValue_(f"Saved {len(files_saved)} file(s)")
+                log.info(f"Save complete: {len(files_saved)} files")
+                
+                # Print file list if verbose
+                if config.verbose and not config.quiet:
+                    print("\nSaved files:")
+                    for f in files_saved:
+                        print(f"  - {f}")
+                
+                # Open in Preview if requested
+                if config.open_in_preview and files_saved:
+                    self._openInPreview(files_saved)
         
-        # Set compression properties
-        properties = {}
-        if format == OutputFormat.JPEG:
-            properties['NSImageCompressionFactor'] = config.jpeg_quality
+        def convertPdfToPng_(self, sender):
+            """
+            Convert all PDF pages to individual PNG files.
+            
+            This method takes the captured PDF data and saves each page as a
+            high-resolution PNG file. It's useful for users who need individual
+            image files from a multi-page PDF scan.
+            
+            Args:
+                sender: The button that triggered this action
+            """
+            if not self.captured_data:
+                log.warning("No PDF data to convert")
+                self.statusLabel.setStringValue_("No PDF data available for conversion")
+                return
+            if self.converting:
+                log.warning("A PDF to PNG conversion is already running")
+                return
+                
+            log.info("Converting PDF pages to PNG format...")
+            self.statusLabel.setStringValue_("Converting PDF pages to PNG...")
+            
+            # Reuse the document parsed at capture time; parse it only if needed
+            pdf_doc = (self.captured_pdf_doc
+                       or QZ.PDFDocument.alloc().initWithData_(self.captured_data))
+            if not pdf_doc:
+                log.error("Failed to create PDF document for conversion")
+                self.statusLabel.setStringValue_("Error: Could not process PDF")
+                return
+                
+            base_name = _export_base_name()
+            page_count = pdf_doc.pageCount()
+            
+            log.info(f"Converting {page_count} PDF page(s) to PNG...")
+            
+            # Pages rasterized at capture time are encoded from those bitmaps
+            # instead of being rendered a second time
+            rendered = [image for image in self.captured_images
+                        if image.isKindOfClass_(AK.NSBitmapImageRep)]
+            
+            # Build one export job per page; the workers render and encode
+            # the pages concurrently while the main thread waits
+            page_at = pdf_doc.pageAtIndex_
+            pages = [page_at(i) for i in range(page_count)]
+            output_dir = config.output_dir_str
+            jobs = []
+            for i, page in enumerate(pages):
+                if page:
+                    filepath = os.path.join(
+                        output_dir, _page_filename(base_name, i + 1, OutputFormat.PNG)
+                    )
+                    # Rendered reps line up with the non-empty pages
+                    rep = rendered[len(jobs)] if len(jobs) < len(rendered) else None
+                    jobs.append((page, filepath, OutputFormat.PNG, rep))
+            
+            def convert():
+                # Runs on a background thread, so the window keeps redrawing
+                # (and shows the status above) while the pages are exported
+                files_saved = []
+                with objc.autorelease_pool():
+                    try:
+                        # Results come back in page order
+                        with _user_activity("Converting PDF pages to PNG"):
+                            results = _run_parallel(_export_pdf_page, jobs)
+                        files_saved = [str(job[3]) for job, saved in zip(jobs, results) if saved]
+                    except Exception:
+                        log.exception("PDF to PNG conversion failed")
+                    finally:
+                        # AppKit may only be touched on the main thread: hand
+                        # the results back there for a single status update.
+                        # This must happen even on failure, or the button
+                        # would stay disabled for good.
+                        self.performSelectorOnMainThread_withObject_waitUntilDone_(
+                            '_finishPngConversion:', files_saved, False
+                        )
+            
+            # Block a second conversion until this one has finished
+            self.converting = True
+            self.convertToPngButton.setEnabled_(False)
+            threading.Thread(target=convert, daemon=True).start()
+        
+        def _finishPngConversion_(self, files_saved):
+            """
+            Report the result of a PDF to PNG conversion (main thread).
+            
+            Args:
+                files_saved: List of paths of the PNG files written
+            """
+            # Only offer another conversion if the current capture is a PDF
+            # that could be parsed (not one kept raw because of its size)
+            self.converting = False
+            self.convertToPngButton.setEnabled_(bool(self.captured_pdf_doc))
+            for f in files_saved:
+                log.info(f"Saved PNG: {f}")
+            
+            # Final status update
+            if files_saved:
+                self.statusLabel.setStringValue_(
+                    f"Successfully converted {len(files_saved)} page(s) to PNG"
+                )
+                log.info(f"PDF to PNG conversion complete: {len(files_saved)} files")
+                
+                # Print file list if verbose
+                if config.verbose and not config.quiet:
+                    print(f"\nConverted {len(files_saved)} PDF pages to PNG:")
+                    for f in files_saved:
+                        print(f"  - {f}")
+                
+                # Open in Preview if configured
+                if config.open_in_preview:
+                    self._openInPreview(files_saved)
+            else:
+                self.statusLabel.setStringValue_("Error: No pages could be converted")
+                log.error("Failed to convert any PDF pages to PNG")
         
-        # Generate data in specified format
-        data = rep.representationUsingType_properties_(
-            type_map[format], properties
-        )
+        @objc.python_method
+        def _openInPreview(self, file_paths=None):
+            """
+            Open saved files in Preview app.
+            
+            Args:
+                file_paths: List of file paths to open
+            """
+            if not file_paths:
+                return
+                
+            log.info(f"Opening {len(file_paths)} file(s) in Preview...")
+            
+            # Locate Preview by its bundle identifier (looked up only once)
+            preview_url = _preview_app_url()
+            if preview_url is None:
+                log.error("Failed to open files in Preview: Preview.app not found")
+                return
+            
+            # Convert file paths to NSURL objects
+            file_url = _file_url()
+            urls = [file_url(str(path)) for path in file_paths]
+            
+            def opened(app, error):
+                # Called by NSWorkspace on a background queue once Preview
+                # has (or has not) opened the files; only log from here
+                if error is not None:
+                    log.error(f"Failed to open files in Preview: {error}")
+                else:
+                    log.info("Files opened in Preview successfully")
+            
+            # Open all files with Preview app. This returns immediately: the
+            # Launch Services round trip happens asynchronously, so the UI
+            # does not stall while Preview starts up.
+            _shared_workspace().openURLs_withApplicationAtURL_configuration_completionHandler_(
+                urls,
+                preview_url,
+                AK.NSWorkspaceOpenConfiguration.configuration(),
+                opened
+            )
+            self.statusLabel.setStringValue_(f"Saved {len(file_paths)} file(s) - Opening in Preview")
         
-        if data:
-            return data.writeToFile_atomically_(str(filepath), True)
-        return False
+        @objc.python_method
+        def _getBestImageRep(self, image=None):
+            """
+            Find the highest resolution bitmap representation of an image.
+            
+            Args:
+                image: NSImage to process, or an NSBitmapImageRep that is
+                    returned as-is
+                
+            Returns:
+                NSBitmapImageRep with highest resolution, or None
+            """
+            if not image:
+                return None
+            # Rendered PDF pages are stored as their bitmap already
+            if image.isKindOfClass_(AK.NSBitmapImageRep):
+                return image
+            
+            # Let Foundation filter out non-bitmap reps (e.g. NSPDFImageRep)
+            # in one call instead of one bridged isKindOfClass_ per rep
+            reps = image.representations().filteredArrayUsingPredicate_(
+                _bitmap_rep_predicate()
+            )
+            if not reps:
+                return None
+            if len(reps) == 1:
+                return reps[0]
+            return max(reps, key=lambda rep: rep.pixelsWide() * rep.pixelsHigh())
 
 
-# ================================
-# Window Controller Implementation
-# ================================
+    # ================================
+    # Window Controller Implementation
+    # ================================
 
-class ContinuityCameraWindowController(NSWindowController):
-    """
-    Window controller that manages the application window.
-    
-    This class demonstrates the window management layer in macOS applications.
-    It creates the window, sets its properties, and manages the view controller.
-    Also implements NSWindowDelegate to handle window events.
-    """
-    
-    def init(self):
+    # Main window geometry and style, evaluated once when the classes are
+    # defined (AppKit is loaded by then)
+    main_window_rect = AK.NSMakeRect(100, 100, 700, 600)
+    main_window_style = (
+        AK.NSWindowStyleMaskTitled |          # Has title bar
+        AK.NSWindowStyleMaskClosable |        # Has close button
+        AK.NSWindowStyleMaskMiniaturizable |  # Has minimize button
+        AK.NSWindowStyleMaskResizable         # Can be resized
+    )
+
+    class ContinuityCameraWindowController(AK.NSWindowController):
         """
-        Initialize the window controller with a configured window.
+        Window controller that manages the application window.
         
-        Returns:
-            self: The initialized window controller
+        This class demonstrates the window management layer in macOS applications.
+        It creates the window, sets its properties, and manages the view controller.
+        Also implements NSWindowDelegate to handle window events.
+        
+        The view controller (and with it all buttons and views) is only
+        created after the window has been shown, so the empty window frame
+        appears on screen as early as possible.
         """
-        # Define window geometry and style
-        content_rect = NSMakeRect(100, 100, 700, 600)
-        style_mask = (
-            NSWindowStyleMaskTitled |          # Has title bar
-            NSWindowStyleMaskClosable |        # Has close button
-            NSWindowStyleMaskMiniaturizable |  # Has minimize button
-            NSWindowStyleMaskResizable         # Can be resized
-        )
         
-        # Create window with specified properties
-        window = NSWindow.alloc().initWithContentRect_styleMask_backing_defer_(
-            content_rect, style_mask, NSBackingStoreBuffered, False
-        )
-        window.setTitle_("iPhone Document Scanner - Educational Edition")
+        def init(self):
+            """
+            Initialize the window controller with a configured window.
+            
+            Returns:
+                self: The initialized window controller
+            """
+            # Create window with the geometry and style defined above
+            window = AK.NSWindow.alloc().initWithContentRect_styleMask_backing_defer_(
+                main_window_rect, main_window_style, AK.NSBackingStoreBuffered, False
+            )
+            window.setTitle_("iPhone Document Scanner - Educational Edition")
+            
+            # Initialize parent class with our window
+            self = objc.super(ContinuityCameraWindowController, self).initWithWindow_(window)
+            if self:
+                # Set self as the window delegate to receive window events
+                window.setDelegate_(self)
+                log.debug("Window controller initialized")
+            
+            return self
+        
+        def showWindow_(self, sender):
+            """
+            Show the window, then build its content on the next event loop turn.
+            
+            Args:
+                sender: The object requesting the window (may be None)
+            """
+            window = self.window()
+            if not window.frameAutosaveName():
+                # First show: put the window where the user left it last
+                # time (stored in the user defaults), centering it only if
+                # there is no saved frame yet; from now on AppKit keeps the
+                # saved frame up to date
+                if not window.setFrameUsingName_(_WINDOW_AUTOSAVE_NAME):
+                    window.center()
+                window.setFrameAutosaveName_(_WINDOW_AUTOSAVE_NAME)
+            
+            objc.super(ContinuityCameraWindowController, self).showWindow_(sender)
+            if window.contentViewController() is None:
+                # A zero delay still returns to the run loop first, so the
+                # window frame is drawn before the views are constructed
+                self.performSelector_withObject_afterDelay_(
+                    '_installViewController:', None, 0.0
+                )
         
-        # Initialize parent class with our window
-        self = objc.super(ContinuityCameraWindowController, self).initWithWindow_(window)
-        if self:
-            # Set self as the window delegate to receive window events
-            window.setDelegate_(self)
+        def _installViewController_(self, _):
+            """
+            Create the view controller and make it the window's content.
             
-            # Create and set the view controller
+            Args:
+                _: Unused (required by performSelector_withObject_afterDelay_)
+            """
+            window = self.window()
+            if window.contentViewController() is not None:
+                return
             view_controller = ContinuityCameraViewController.alloc().init()
+            # Installing the content resizes the window to the view; keep the
+            # frame restored from the autosave instead
+            frame = window.frame()
             window.setContentViewController_(view_controller)
-            window.center()  # Center window on screen
-            logging.debug("Window controller initialized")
-        
-        return self
-    
-    def windowWillClose_(self, notification):
-        """
-        Called when the window is about to close.
-        
-        This method terminates the application when the main window is closed.
+            window.setFrame_display_(frame, True)
+            log.debug("View controller installed")
         
-        Args:
-            notification: NSNotification object containing window information
-        """
-        logging.info("Main window closing, terminating application...")
-        NSApp.terminate_(self)
+        def windowWillClose_(self, notification):
+            """
+            Called when the window is about to close.
+            
+            This method terminates the application when the main window is closed.
+            
+            Args:
+                notification: NSNotification object containing window information
+            """
+            log.info("Main window closing, terminating application...")
+            # Terminate on the next run loop turn, once the window has
+            # finished closing, rather than from inside its close sequence
+            _shared_application().performSelector_withObject_afterDelay_(
+                'terminate:', self, 0.0
+            )
 
 
 # ================================
@@ -906,10 +1665,15 @@ class EnhancedContinuityCameraApp:
     - Event loop handling
     """
     
+    # One instance per process; slots keep attribute access off a __dict__
+    __slots__ = ('app', 'window_controller', 'exit_code')
+    
     def __init__(self):
         """Initialize the application."""
-        self.app = NSApplication.sharedApplication()
+        _load_cocoa_classes()
+        self.app = _shared_application()
         self.window_controller = None
+        self.exit_code = 0
         
     def run_interactive(self):
         """
@@ -917,39 +1681,160 @@ class EnhancedContinuityCameraApp:
         
         This method:
         1. Sets the application to appear in the Dock
-        2. Creates and shows the main window
-        3. Brings the app to the foreground
+        2. Creates the main window controller
+        3. Queues showing the window and activating the app (see _present)
         4. Starts the event loop
+        
+        Returns:
+            int: Exit status, non-zero if startup failed
         """
-        logging.info("Starting interactive mode...")
+        log.info("Starting interactive mode...")
         
         # Make app appear in Dock and menu bar
-        self.app.setActivationPolicy_(NSApplicationActivationPolicyRegular)
+        self.app.setActivationPolicy_(AK.NSApplicationActivationPolicyRegular)
         
-        # Create and show window
+        # Create the window controller; showing the window and activating
+        # the app happen as the first job of the event loop, so AppKit's own
+        # launch work is not held up by ours
         self.window_controller = ContinuityCameraWindowController.alloc().init()
-        self.window_controller.showWindow_(None)
-        
-        # Bring to foreground
-        self.app.activateIgnoringOtherApps_(True)
+        FN.NSOperationQueue.mainQueue().addOperationWithBlock_(self._present)
         
         # Start event loop (blocks until app quits)
         self.app.run()
+        return self.exit_code
+    
+    def _present(self):
+        """Show the main window and bring the app to the front (main thread)."""
+        self.window_controller.showWindow_(None)
+        self.app.activateIgnoringOtherApps_(True)
+        
+        # Filesystem checks and the console banner are queued behind this,
+        # so they do not delay the window appearing
+        FN.NSOperationQueue.mainQueue().addOperationWithBlock_(self._finish_launch)
+    
+    def _finish_launch(self):
+        """Prepare the output directory and greet the user (main thread)."""
+        if not prepare_output_dir():
+            self.exit_code = 1
+            self.stop()
+            return
+        # Nobody sees the banner when launched from Finder (stdout is not a
+        # terminal then), so skip building it
+        if not config.quiet and sys.stdout.isatty():
+            print_welcome()
+    
+    def stop(self):
+        """Leave the event loop so run_interactive() returns."""
+        self.app.stop_(None)
+        # stop_ only takes effect after the next event has been handled, so
+        # post an empty one to wake the loop up
+        event = AK.NSEvent.otherEventWithType_location_modifierFlags_timestamp_windowNumber_context_subtype_data1_data2_(
+            AK.NSEventTypeApplicationDefined, (0, 0), 0, 0.0, 0, None, 0, 0, 0
+        )
+        self.app.postEvent_atStart_(event, True)
 
 
 # ================================
 # Command-Line Interface
 # ================================
 
-def create_argument_parser():
+def _clamp(value, low, high):
     """
-    Create and configure the argument parser for CLI usage.
+    Limit a value to the range [low, high].
     
+    Args:
+        value: Number to limit
+        low: Smallest allowed value
+        high: Largest allowed value
+        
     Returns:
-        argparse.ArgumentParser: Configured parser
+        The value, or the nearest bound if it lies outside the range
     """
-    parser = argparse.ArgumentParser(
-        description="""
+    return low if value < low else high if value > high else value
+
+
+def _parse_float(text):
+    """
+    Convert a command line value to float (argparse ``type`` helper).
+    
+    Raises:
+        argparse.ArgumentTypeError: If the text is not a finite number
+    """
+    try:
+        value = float(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid float value: {text!r}") from None
+    # float() accepts 'nan' and 'inf', which no option can use
+    if not math.isfinite(value):
+        raise argparse.ArgumentTypeError(f"value must be a finite number: {text!r}")
+    return value
+
+
+def _parse_quality(text):
+    """argparse ``type`` for --jpeg-quality: a float clamped to 0.0-1.0."""
+    return _clamp(_parse_float(text), 0.0, 1.0)
+
+
+def _parse_scale(text):
+    """argparse ``type`` for --resolution-scale: a float of at least 1.0."""
+    return max(1.0, _parse_float(text))
+
+
+def _parse_megabytes(text):
+    """
+    argparse ``type`` for --max-pdf-size: a positive size in MB, as bytes.
+    
+    Raises:
+        argparse.ArgumentTypeError: If the size is not a positive number
+    """
+    value = _parse_float(text)
+    if value <= 0:
+        raise argparse.ArgumentTypeError(f"size must be positive: {text!r}")
+    return int(value * 1024 * 1024)
+
+
+def _parse_output_dir(text):
+    """
+    argparse ``type`` for --output-dir: the path with ``~`` expanded.
+    
+    The path is not resolved here, which would touch the filesystem; that
+    happens in prepare_output_dir() once the window is up.
+    """
+    return Path(text).expanduser()
+
+
+# Format names accepted by --format, and the OutputFormat each one means
+_FORMAT_CHOICES = tuple(f.extension for f in OutputFormat)
+_FORMAT_MAP = dict(zip(_FORMAT_CHOICES, OutputFormat))
+
+
+def _parse_format(name):
+    """
+    Convert a format name from the command line to an OutputFormat.
+    
+    Used as the argparse ``type`` for --format, so each name is converted
+    once while parsing, with a single lookup in _FORMAT_MAP.
+    
+    Args:
+        name: Format name such as 'pdf' or 'png' (case-insensitive)
+        
+    Returns:
+        OutputFormat: The matching format
+        
+    Raises:
+        argparse.ArgumentTypeError: If the name is not a supported format
+    """
+    fmt = _FORMAT_MAP.get(name.lower())
+    if fmt is None:
+        raise argparse.ArgumentTypeError(
+            f"invalid choice: {name!r} (choose from {', '.join(_FORMAT_CHOICES)})"
+        )
+    return fmt
+
+
+# Description shown by --help. argparse keeps a reference to this constant
+# and only formats it (expanding %(prog)s) when the help is printed.
+_DESCRIPTION = """
 iPhone Document Scanner for macOS - Educational Edition
 
 This tool allows you to scan documents directly from your iPhone camera
@@ -968,7 +1853,18 @@ Example usage:
   %(prog)s --format pdf png          # Save as both PDF and PNG
   %(prog)s --prefix invoice          # Use 'invoice' as filename prefix
   %(prog)s --verbose                 # Show detailed information
-        """,
+        """
+
+
+def create_argument_parser():
+    """
+    Create and configure the argument parser for CLI usage.
+    
+    Returns:
+        argparse.ArgumentParser: Configured parser
+    """
+    parser = argparse.ArgumentParser(
+        description=_DESCRIPTION,
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
     
@@ -976,8 +1872,8 @@ Example usage:
     output_group = parser.add_argument_group('output options')
     output_group.add_argument(
         '-o', '--output-dir',
-        type=str,
-        default=str(Path.cwd()),
+        type=_parse_output_dir,
+        default=None,  # The current directory, looked up only when needed
         help='Directory to save scanned documents (default: current directory)'
     )
     output_group.add_argument(
@@ -989,8 +1885,9 @@ Example usage:
     output_group.add_argument(
         '-f', '--format',
         nargs='+',
-        choices=['pdf', 'png', 'jpeg', 'tiff'],
-        default=['pdf', 'png'],
+        type=_parse_format,
+        metavar='{' + ','.join(_FORMAT_CHOICES) + '}',
+        default=[OutputFormat.PDF, OutputFormat.PNG],
         help='Output formats (default: pdf png)'
     )
     output_group.add_argument(
@@ -1003,18 +1900,26 @@ Example usage:
     quality_group = parser.add_argument_group('quality options')
     quality_group.add_argument(
         '--jpeg-quality',
-        type=float,
+        type=_parse_quality,
         default=0.95,
         metavar='0.0-1.0',
         help='JPEG compression quality (default: 0.95)'
     )
     quality_group.add_argument(
         '--resolution-scale',
-        type=float,
+        type=_parse_scale,
         default=4.0,
         metavar='SCALE',
         help='Resolution scale factor for PDF rendering (default: 4.0)'
     )
+    quality_group.add_argument(
+        '--max-pdf-size',
+        type=_parse_megabytes,
+        default=None,
+        metavar='MB',
+        help='Largest scanned PDF that is previewed and rendered; larger '
+             'scans are only saved as PDF (default: 256)'
+    )
     
     # Logging options
     logging_group = parser.add_argument_group('logging options')
@@ -1039,7 +1944,7 @@ Example usage:
     info_group.add_argument(
         '--version',
         action='version',
-        version='%(prog)s 2.0.0'
+        version=f'%(prog)s {__version__}'
     )
     info_group.add_argument(
         '--list-formats',
@@ -1050,30 +1955,102 @@ Example usage:
     return parser
 
 
+# Text printed by --list-formats, written in one go
+_FORMATS_HELP = """
+Supported Output Formats:
+========================================
+
+PDF (Portable Document Format)
+  - Best for multi-page documents
+  - Preserves vector graphics
+  - Smaller file size
+  - Universal compatibility
+
+PNG (Portable Network Graphics)
+  - Lossless compression
+  - Best for documents with text
+  - Supports transparency
+  - Larger file size
+
+JPEG (Joint Photographic Experts Group)
+  - Lossy compression
+  - Smaller file size
+  - Best for photos
+  - Quality adjustable (--jpeg-quality)
+
+TIFF (Tagged Image File Format)
+  - Professional format
+  - Can store multiple images
+  - Lossless compression
+  - Large file size
+"""
+
+
 def list_formats():
     """Display information about supported formats."""
-    print("\nSupported Output Formats:")
-    print("=" * 40)
-    print("\nPDF (Portable Document Format)")
-    print("  - Best for multi-page documents")
-    print("  - Preserves vector graphics")
-    print("  - Smaller file size")
-    print("  - Universal compatibility")
-    print("\nPNG (Portable Network Graphics)")
-    print("  - Lossless compression")
-    print("  - Best for documents with text")
-    print("  - Supports transparency")
-    print("  - Larger file size")
-    print("\nJPEG (Joint Photographic Experts Group)")
-    print("  - Lossy compression")
-    print("  - Smaller file size")
-    print("  - Best for photos")
-    print("  - Quality adjustable (--jpeg-quality)")
-    print("\nTIFF (Tagged Image File Format)")
-    print("  - Professional format")
-    print("  - Can store multiple images")
-    print("  - Lossless compression")
-    print("  - Large file size")
+    sys.stdout.write(_FORMATS_HELP)
+
+
+def prepare_output_dir():
+    """
+    Resolve the output directory and create it if it does not exist.
+    
+    Returns:
+        bool: True if the directory is usable, False otherwise (logged)
+    """
+    # This runs from the event loop, outside main()'s error handling, so
+    # every filesystem check is guarded (exists() can raise PermissionError)
+    try:
+        config.output_dir = config.output_dir.resolve()
+        if not config.output_dir.exists():
+            config.output_dir.mkdir(parents=True)
+            log.info(f"Created output directory: {config.output_dir}")
+        
+        if not config.output_dir.is_dir():
+            log.error(f"Output path is not a directory: {config.output_dir}")
+            return False
+    except OSError as e:
+        log.error(f"Cannot use output directory: {e}")
+        return False
+    return True
+
+
+def print_welcome():
+    """Print the welcome banner with the active settings and instructions."""
+    # Build the whole banner first and write it with a single call
+    lines = [
+        "",
+        "=" * 60,
+        "iPhone Document Scanner - Educational Edition",
+        "=" * 60,
+        "",
+        f"Output Directory: {config.output_dir}",
+        f"Filename Prefix: {config.filename_prefix}",
+        f"Output Formats: {config.output_formats_display}",
+    ]
+    
+    if config.open_in_preview:
+        lines.append("Open in Preview: ENABLED")
+    
+    if config.debug_mode:
+        lines.append("Debug Mode: ENABLED (pasteboard inspection available)")
+    
+    lines += [
+        "",
+        "-" * 60,
+        "Instructions:",
+        "1. Click 'Scan Document' button",
+        "2. Select 'Scan Documents' from your iPhone",
+        "3. Position and scan your document(s)",
+        "4. Tap 'Save' on your iPhone when done",
+        "5. Click 'Save All Pages' to save to disk",
+    ]
+    
+    if config.debug_mode:
+        lines += ["", "Debug: Click 'Debug Pasteboard' to inspect data transfer"]
+    
+    lines += ["-" * 60, "", ""]
+    sys.stdout.write("\n".join(lines))
 
 
 def main():
@@ -1085,6 +2062,16 @@ def main():
     2. Configures the application based on arguments
     3. Starts the GUI application
     """
+    # --version and --list-formats only print and exit: answer them before
+    # building the full parser (argparse still documents them in --help)
+    argv = sys.argv[1:]
+    if '--version' in argv:
+        sys.stdout.write(f"{os.path.basename(sys.argv[0])} {__version__}\n")
+        sys.exit(0)
+    if '--list-formats' in argv:
+        list_formats()
+        sys.exit(0)
+    
     # Parse command-line arguments
     parser = create_argument_parser()
     args = parser.parse_args()
@@ -1095,71 +2082,35 @@ def main():
         sys.exit(0)
     
     # Configure application from arguments
-    config.output_dir = Path(args.output_dir).expanduser().resolve()
+    # The directory is resolved (and created if needed) once the window is
+    # up, see prepare_output_dir(); without -o it is the current directory
+    if args.output_dir is not None:
+        config.output_dir = args.output_dir
     config.filename_prefix = args.prefix
     config.verbose = args.verbose
     config.quiet = args.quiet
     config.debug_mode = args.debug
-    config.jpeg_quality = max(0.0, min(1.0, args.jpeg_quality))
-    config.resolution_scale = max(1.0, args.resolution_scale)
+    # Values were already converted and clamped by the argparse type callables
+    config.jpeg_quality = args.jpeg_quality
+    config.resolution_scale = args.resolution_scale
+    if args.max_pdf_size is not None:
+        config.max_pasteboard_bytes = args.max_pdf_size
     config.open_in_preview = args.open_preview
     
-    # Convert format strings to enum values
-    config.output_formats = [OutputFormat(f) for f in args.format]
-    
-    # Setup logging
-    config.setup_logging()
-    
-    # Validate output directory
-    if not config.output_dir.exists():
-        try:
-            config.output_dir.mkdir(parents=True)
-            logging.info(f"Created output directory: {config.output_dir}")
-        except Exception as e:
-            logging.error(f"Cannot create output directory: {e}")
-            sys.exit(1)
-    
-    if not config.output_dir.is_dir():
-        logging.error(f"Output path is not a directory: {config.output_dir}")
-        sys.exit(1)
+    config.output_formats = args.format
     
-    # Display welcome message
-    if not config.quiet:
-        print("\n" + "=" * 60)
-        print("iPhone Document Scanner - Educational Edition")
-        print("=" * 60)
-        print(f"\nOutput Directory: {config.output_dir}")
-        print(f"Filename Prefix: {config.filename_prefix}")
-        print(f"Output Formats: {', '.join(f.value.upper() for f in config.output_formats)}")
-        
-        if config.open_in_preview:
-            print("Open in Preview: ENABLED")
-        
-        if config.debug_mode:
-            print("Debug Mode: ENABLED (pasteboard inspection available)")
-        
-        print("\n" + "-" * 60)
-        print("Instructions:")
-        print("1. Click 'Scan Document' button")
-        print("2. Select 'Scan Documents' from your iPhone")
-        print("3. Position and scan your document(s)")
-        print("4. Tap 'Save' on your iPhone when done")
-        print("5. Click 'Save All Pages' to save to disk")
-        
-        if config.debug_mode:
-            print("\nDebug: Click 'Debug Pasteboard' to inspect data transfer")
-        
-        print("-" * 60 + "\n")
+    # Setup logging and prebuild per-format encoder settings
+    config.finalize()
     
     # Start the application
     try:
         app = EnhancedContinuityCameraApp()
-        app.run_interactive()
+        sys.exit(app.run_interactive())
     except KeyboardInterrupt:
-        logging.info("Application interrupted by user")
+        log.info("Application interrupted by user")
         sys.exit(0)
     except Exception as e:
-        logging.error(f"Application error: {e}")
+        log.error(f"Application error: {e}")
         sys.exit(1)
 
 